@@ -8,15 +8,24 @@ Runners authenticate with a single API key issued from the admin panel.
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import json
 import logging
 import os
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 # Retry configuration constants
@@ -24,8 +33,24 @@ DEFAULT_MAX_RETRIES = 3
 RETRY_BACKOFF_MULTIPLIER = 2  # Exponential backoff: 1s, 2s, 4s, 8s
 RETRY_INITIAL_DELAY = 1.0  # Initial delay in seconds
 
+# HTTP/2 lets concurrent calls (progress posts, heartbeats, log batches) share one
+# connection; httpx only supports it when the optional `h2` package is installed.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP_KEEPALIVE_LIMITS = httpx.Limits(max_keepalive_connections=20)
+
+
+def _dumps(obj: Any) -> bytes | str:
+    """Serialize a request body, using orjson when it is installed.
+
+    Results and log batches are the largest payloads a runner sends; orjson
+    encodes them several times faster and straight to the bytes httpx sends.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj)
 
-@dataclass
+
+@dataclass(slots=True)
 class ScraperConfig:
     """Configuration for a single scraper."""
 
@@ -41,7 +66,7 @@ class ScraperConfig:
     validation: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobConfig:
     """Job configuration received from the coordinator."""
 
@@ -57,7 +82,7 @@ class JobConfig:
     lease_expires_at: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaimedChunk:
     chunk_id: str
     job_id: str
@@ -109,11 +134,11 @@ def _normalize_selectors_payload(raw_selectors: Any) -> list[dict[str, Any]]:
         for field_name, field_config in raw_selectors.items():
             if not isinstance(field_config, dict):
                 continue
-
-            item = dict(field_config)
-            if "name" not in item and isinstance(field_name, str):
-                item["name"] = field_name
-            normalized.append(item)
+            # Only copy when a name must be added; the caller's payload is
+            # never mutated, and validation does not mutate items
+            if "name" not in field_config and isinstance(field_name, str):
+                field_config = {**field_config, "name": field_name}
+            normalized.append(field_config)
         return normalized
 
     return []
@@ -181,6 +206,39 @@ class ScraperAPIClient:
         if not self.api_key:
             logger.warning("SCRAPER_API_KEY not configured")
 
+        # Created on first request and reused so consecutive calls share
+        # pooled keep-alive connections instead of a fresh TCP/TLS handshake each.
+        self._http_client: httpx.Client | None = None
+        self._http_client_lock = threading.Lock()
+
+    def _get_http_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use."""
+        client = self._http_client
+        if client is None:
+            with self._http_client_lock:
+                client = self._http_client
+                if client is None:
+                    client = httpx.Client(
+                        timeout=self.timeout,
+                        http2=HTTP2_AVAILABLE,
+                        limits=HTTP_KEEPALIVE_LIMITS,
+                    )
+                    self._http_client = client
+        return client
+
+    def close(self) -> None:
+        """Close pooled HTTP connections. The client reconnects if used again."""
+        with self._http_client_lock:
+            client, self._http_client = self._http_client, None
+        if client is not None:
+            client.close()
+
+    def __enter__(self) -> ScraperAPIClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def health_check(self) -> bool:
         """
         Perform a quick health check to verify API connectivity.
@@ -203,16 +261,15 @@ class ScraperAPIClient:
         health_url = f"{self.api_url.rstrip('/')}/api/health"
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(health_url, headers=self._get_headers())
+            response = self._get_http_client().get(health_url, headers=self._get_headers())
 
-                if response.status_code == 200:
-                    logger.info(f"[API Client] Health check passed: {self.api_url}")
-                    return True
-                else:
-                    error_msg = f"Health check failed: API returned status {response.status_code} (expected 200 OK)"
-                    logger.error(f"[API Client] {error_msg}")
-                    raise ConnectionError(error_msg)
+            if response.status_code == 200:
+                logger.info(f"[API Client] Health check passed: {self.api_url}")
+                return True
+            else:
+                error_msg = f"Health check failed: API returned status {response.status_code} (expected 200 OK)"
+                logger.error(f"[API Client] {error_msg}")
+                raise ConnectionError(error_msg)
 
         except httpx.NetworkError as e:
             error_msg = f"Health check failed: Network error - {str(e)}"
@@ -245,7 +302,7 @@ class ScraperAPIClient:
         self,
         method: str,
         endpoint: str,
-        payload: str | None = None,
+        payload: bytes | str | None = None,
     ) -> dict[str, Any]:
         """
         Make an authenticated HTTP request with retry logic and exponential backoff.
@@ -261,19 +318,19 @@ class ScraperAPIClient:
 
         for attempt in range(self.max_retries + 1):
             try:
-                with httpx.Client(timeout=self.timeout) as client:
-                    if method.upper() == "GET":
-                        response = client.get(url, headers=headers)
-                    else:
-                        response = client.post(url, headers=headers, content=payload)
+                client = self._get_http_client()
+                if method.upper() == "GET":
+                    response = client.get(url, headers=headers)
+                else:
+                    response = client.post(url, headers=headers, content=payload)
 
-                    # Authentication failure - not retryable
-                    if response.status_code == 401:
-                        raise AuthenticationError("Invalid API key")
+                # Authentication failure - not retryable
+                if response.status_code == 401:
+                    raise AuthenticationError("Invalid API key")
 
-                    # Raise for status on HTTP errors
-                    response.raise_for_status()
-                    return response.json()
+                # Raise for status on HTTP errors
+                response.raise_for_status()
+                return response.json()
 
             except httpx.HTTPStatusError as e:
                 status_code = e.response.status_code
@@ -385,7 +442,7 @@ class ScraperAPIClient:
         if error_message:
             payload_dict["error_message"] = error_message
 
-        payload = json.dumps(payload_dict)
+        payload = _dumps(payload_dict)
 
         try:
             self._make_request("POST", "/api/admin/scraping/callback", payload=payload)
@@ -429,7 +486,7 @@ class ScraperAPIClient:
         if job_id:
             payload_dict["job_id"] = job_id
 
-        payload = json.dumps(payload_dict)
+        payload = _dumps(payload_dict)
 
         try:
             data = self._make_request("POST", "/api/scraper/v1/claim-chunk", payload=payload)
@@ -485,7 +542,7 @@ class ScraperAPIClient:
         if error_message:
             payload_dict["error_message"] = error_message
 
-        payload = json.dumps(payload_dict)
+        payload = _dumps(payload_dict)
 
         try:
             self._make_request("POST", "/api/scraper/v1/chunk-callback", payload=payload)
@@ -539,7 +596,7 @@ class ScraperAPIClient:
             },
         }
 
-        payload = json.dumps(payload_dict)
+        payload = _dumps(payload_dict)
 
         try:
             self._make_request("POST", "/api/scraper/v1/chunk-callback", payload=payload)
@@ -571,7 +628,7 @@ class ScraperAPIClient:
             logger.error("API client not configured - missing URL")
             return None
 
-        payload = json.dumps(
+        payload = _dumps(
             {
                 "runner_name": self.runner_name,
             }
@@ -663,7 +720,7 @@ class ScraperAPIClient:
         if status:
             payload_dict["status"] = status
 
-        payload = json.dumps(payload_dict)
+        payload = _dumps(payload_dict)
 
         try:
             response_data = self._make_request("POST", "/api/scraper/v1/heartbeat", payload=payload)
@@ -696,7 +753,7 @@ class ScraperAPIClient:
         if not self.api_url:
             return False
 
-        payload = json.dumps({"job_id": job_id, "logs": logs})
+        payload = _dumps({"job_id": job_id, "logs": logs})
 
         try:
             self._make_request("POST", "/api/scraper/v1/logs", payload=payload)
@@ -13,6 +13,7 @@ Key Design Principles:
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import threading
@@ -23,7 +24,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 logger = logging.getLogger(__name__)
 
@@ -204,6 +205,9 @@ class EventBus:
         self._max_jobs = max_jobs
         self._lock = threading.Lock()
         self._persist_path = persist_path
+        # Opened on first persist and kept open; writes are buffered and reach
+        # disk in blocks (or on flush()) instead of one open/close per event
+        self._persist_file: TextIO | None = None
 
         # Per-job event tracking
         self._job_events: dict[str, list[ScraperEvent]] = {}
@@ -305,6 +309,26 @@ class EventBus:
         events = self.get_events(job_id, event_types, since, limit)
         return [e.to_dict() for e in events]
 
+    def flush(self) -> None:
+        """Write any buffered persisted events to disk."""
+        with self._lock:
+            if self._persist_file is not None:
+                try:
+                    self._persist_file.flush()
+                except Exception as e:
+                    logger.error(f"Failed to flush persisted events: {e}")
+
+    def close(self) -> None:
+        """Flush and close the persisted events file, if one is open."""
+        with self._lock:
+            if self._persist_file is not None:
+                try:
+                    self._persist_file.close()
+                except Exception as e:
+                    logger.error(f"Failed to close persisted events file: {e}")
+                finally:
+                    self._persist_file = None
+
     def clear_job(self, job_id: str) -> None:
         """Clear events for a specific job."""
         with self._lock:
@@ -312,14 +336,15 @@ class EventBus:
                 del self._job_events[job_id]
 
     def _persist_event(self, event: ScraperEvent) -> None:
-        """Persist event to JSON file (append mode)."""
+        """Persist event to JSON file (append mode, line buffered)."""
         if not self._persist_path:
             return
 
         try:
-            self._persist_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._persist_path, "a", encoding="utf-8") as f:
-                f.write(event.to_json() + "\n")
+            if self._persist_file is None:
+                self._persist_path.parent.mkdir(parents=True, exist_ok=True)
+                self._persist_file = open(self._persist_path, "a", encoding="utf-8", buffering=1)
+            self._persist_file.write(event.to_json() + "\n")
         except Exception as e:
             logger.error(f"Failed to persist event: {e}")
 
@@ -930,6 +955,7 @@ _default_persist_path = Path(__file__).parent.parent.parent / "data" / "events"
 
 # Global event bus - accessible across the application
 event_bus = EventBus(buffer_size=1000, persist_path=_default_persist_path)
+atexit.register(event_bus.close)
 
 
 def create_emitter(job_id: str) -> EventEmitter:
@@ -36,7 +36,7 @@ import signal
 import sys
 import time
 import asyncio
-from datetime import datetime
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
@@ -75,6 +75,8 @@ if env_file.exists():
 
 from core.api_client import ClaimedChunk, ScraperAPIClient, JobConfig
 from core.realtime_manager import RealtimeManager
+from runner import create_log_entry
+from utils.api_handler import LogBatcher
 from utils.logger import setup_logging
 
 
@@ -83,6 +85,11 @@ POLL_INTERVAL = int(os.environ.get("POLL_INTERVAL", "30"))
 MAX_JOBS_BEFORE_RESTART = int(os.environ.get("MAX_JOBS_BEFORE_RESTART", "100"))
 HEARTBEAT_INTERVAL = 60  # Send heartbeat every 60 seconds when idle
 
+try:
+    VERSION = (PROJECT_ROOT / "VERSION").read_text().strip()
+except OSError:
+    VERSION = "unknown"
+
 # Setup logging
 setup_logging(debug_mode=False)
 logger = logging.getLogger("daemon")
@@ -99,14 +106,6 @@ def signal_handler(signum, frame):
     _shutdown_requested = True
 
 
-def _create_log_entry(level: str, message: str) -> dict[str, str]:
-    return {
-        "level": level,
-        "message": message,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-    }
-
-
 def run_job(
     job_config: JobConfig,
     client: ScraperAPIClient,
@@ -126,9 +125,7 @@ def run_job(
             creds = client.get_credentials(scraper.name)
             if creds:
                 # Inject credentials into scraper options
-                if scraper.options is None:
-                    scraper.options = {}
-                scraper.options["_credentials"] = creds
+                scraper.options = {**(scraper.options or {}), "_credentials": creds}
                 logger.debug(f"Injected credentials for {scraper.name}")
 
     return run_job(job_config, runner_name=client.runner_name, log_buffer=log_buffer)
@@ -139,21 +136,28 @@ def run_claimed_chunk(
     client: ScraperAPIClient,
     log_buffer: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
-    job_config = client.get_job_config(chunk.job_id)
-    if not job_config:
+    # Fetched per chunk so config edits and new lease tokens take effect
+    # between chunks of a long-running job
+    base_job_config = client.get_job_config(chunk.job_id)
+    if not base_job_config:
         raise RuntimeError(f"Failed to fetch job config for chunk job {chunk.job_id}")
 
-    job_config.skus = chunk.skus
-    job_config.test_mode = chunk.test_mode
-    job_config.max_workers = chunk.max_workers
-
+    scrapers = base_job_config.scrapers
     if chunk.scrapers:
-        job_config.scrapers = [
+        scrapers = [
             s
-            for s in job_config.scrapers
+            for s in scrapers
             if s.name in chunk.scrapers or (s.display_name and s.display_name in chunk.scrapers)
         ]
 
+    job_config = replace(
+        base_job_config,
+        skus=list(chunk.skus),
+        test_mode=chunk.test_mode,
+        max_workers=chunk.max_workers,
+        scrapers=scrapers,
+    )
+
     return run_job(job_config, client, log_buffer)
 
 
@@ -171,18 +175,12 @@ async def main_async():
     # Initialize API client
     client = ScraperAPIClient()
 
-    # Read version
-    version = "unknown"
-    version_file = PROJECT_ROOT / "VERSION"
-    if version_file.exists():
-        version = version_file.read_text().strip()
-
     if not client.api_url or not client.api_key:
         logger.error("Missing SCRAPER_API_URL or SCRAPER_API_KEY. Cannot start daemon.")
         sys.exit(1)
 
     logger.info("=" * 60)
-    logger.info(f"Bay State Scraper Daemon Starting (v{version})")
+    logger.info(f"Bay State Scraper Daemon Starting (v{VERSION})")
     logger.info("=" * 60)
     logger.info(f"Environment: {args.env.upper()}")
     logger.info(f"Runner Name: {client.runner_name}")
@@ -235,17 +233,18 @@ async def main_async():
             if chunk:
                 logger.info(f"[Chunk {chunk.chunk_id}] Claimed - job={chunk.job_id}, skus={len(chunk.skus)}")
 
+                # Streams chunk logs to the API in batches while the chunk runs
+                chunk_logs = LogBatcher(client, chunk.job_id)
                 try:
                     await asyncio.to_thread(client.heartbeat, current_job_id=chunk.job_id, lease_token=chunk.lease_token, status="busy")
                     if rm and rm.is_connected:
                         await rm.broadcast_job_progress(chunk.job_id, "started", 0, "Chunk processing started")
 
-                    chunk_logs: list[dict[str, Any]] = []
-                    chunk_logs.append(_create_log_entry("info", f"Daemon claimed chunk {chunk.chunk_id} for job {chunk.job_id}"))
+                    chunk_logs.append(create_log_entry("info", f"Daemon claimed chunk {chunk.chunk_id} for job {chunk.job_id}"))
                     start_time = time.time()
                     results = await asyncio.to_thread(run_claimed_chunk, chunk, client, chunk_logs)
                     elapsed = time.time() - start_time
-                    chunk_logs.append(_create_log_entry("info", f"Daemon completed chunk in {elapsed:.1f}s"))
+                    chunk_logs.append(create_log_entry("info", f"Daemon completed chunk in {elapsed:.1f}s"))
 
                     chunk_results = {
                         "skus_processed": results.get("skus_processed", 0),
@@ -253,7 +252,7 @@ async def main_async():
                         "skus_failed": results.get("skus_processed", 0) - len(results.get("data", {})),
                         "data": results.get("data", {}),
                         "telemetry": results.get("telemetry", {}),
-                        "logs": results.get("logs", []),
+                        # No "logs": chunk_logs already streams them to the API
                     }
 
                     await asyncio.to_thread(
@@ -263,19 +262,11 @@ async def main_async():
                         results=chunk_results,
                     )
 
-                    if chunk_logs:
-                        try:
-                            await asyncio.to_thread(client.post_logs, chunk.job_id, chunk_logs)
-                        except Exception as log_error:
-                            logger.warning(f"[Chunk {chunk.chunk_id}] Failed to send logs: {log_error}")
-
                     chunks_completed += 1
                     logger.info(f"[Chunk {chunk.chunk_id}] Completed in {elapsed:.1f}s - {results.get('skus_processed', 0)} SKUs processed")
 
                 except Exception as e:
-                    failure_logs = [
-                        _create_log_entry("error", f"Daemon failed chunk {chunk.chunk_id}: {type(e).__name__} - {e}"),
-                    ]
+                    chunk_logs.append(create_log_entry("error", f"Daemon failed chunk {chunk.chunk_id}: {type(e).__name__} - {e}"))
                     logger.exception(f"[Chunk {chunk.chunk_id}] Failed with error")
                     await asyncio.to_thread(
                         client.submit_chunk_results,
@@ -283,10 +274,9 @@ async def main_async():
                         "failed",
                         error_message=str(e),
                     )
-                    try:
-                        await asyncio.to_thread(client.post_logs, chunk.job_id, failure_logs)
-                    except Exception as log_error:
-                        logger.warning(f"[Chunk {chunk.chunk_id}] Failed to send error logs: {log_error}")
+                finally:
+                    # Ships only the entries not already streamed
+                    await asyncio.to_thread(chunk_logs.close)
 
             else:
                 now = time.time()
@@ -303,6 +293,7 @@ async def main_async():
 
     if rm:
         await rm.disconnect()
+    client.close()
 
     logger.info("=" * 60)
     logger.info(f"Daemon shutting down. Chunks completed: {chunks_completed}")
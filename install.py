@@ -9,11 +9,15 @@ Usage:
     curl -sSL https://raw.githubusercontent.com/Bay-State-Pet-and-Garden-Supply/BayStateScraper/main/install.py | python3
 """
 
-import os
+from __future__ import annotations
+
+import functools
 import subprocess
 import sys
 import platform
-import urllib.request
+import re
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 # --- Configuration Constants ---
@@ -21,15 +25,39 @@ DEFAULT_API_URL = "https://bay-state-app.vercel.app"
 REPO_RAW_URL = "https://raw.githubusercontent.com/Bay-State-Pet-and-Garden-Supply/BayStateScraper/main"
 DOCKER_COMPOSE_URL = f"{REPO_RAW_URL}/docker-compose.yml"
 
-INSTALL_DIR = Path(os.getcwd())  # Install in current directory
+INSTALL_DIR = Path.cwd()  # Install in current directory
 ENV_FILE = INSTALL_DIR / ".env"
 COMPOSE_FILE = INSTALL_DIR / "docker-compose.yml"
 
+# Host facts, looked up once per run
+SYSTEM = platform.system()
+HOSTNAME = platform.node()
+IS_WINDOWS = SYSTEM == "Windows"
+
+DOCKER_BIN = "docker"  # Replaced with the resolved path by check_docker_installed()
+
+# Static banners, built once and emitted with a single write each
+HEADER = (
+    "=" * 60 + "\n"
+    "         Bay State Scraper - Runner Setup (Docker)          \n"
+    + "=" * 60 + "\n"
+)
+
+OUTRO = (
+    "\n" + "=" * 60 + "\n"
+    "  ✅ Installation Complete!\n"
+    + "=" * 60 + "\n\n"
+    "  The scraper is now running in the background via Docker.\n"
+    "  It will automatically connect to Vercel and poll for jobs.\n"
+    "\n"
+    "  Useful Commands:\n"
+    "    • View logs:    docker compose logs -f\n"
+    "    • Stop runner:  docker compose down\n"
+    "    • Update:       docker compose up -d --build\n"
+)
+
 def print_header():
-    print("=" * 60)
-    print("         Bay State Scraper - Runner Setup (Docker)          ")
-    print("=" * 60)
-    print()
+    print(HEADER)
 
 def print_step(msg: str):
     print(f"\n---> {msg}")
@@ -44,43 +72,81 @@ def print_error_and_exit(msg: str):
 
 def check_docker_installed():
     """Verify Docker and Docker Compose plugin are available."""
+    global DOCKER_BIN
     print_step("Checking prerequisites...")
     try:
-        # Check docker
+        # One PATH lookup; the resolved binary is reused for every later call
+        # and lets us skip spawning a shell just to find docker on Windows.
+        DOCKER_BIN = shutil.which("docker")
+        if DOCKER_BIN is None:
+            raise FileNotFoundError("docker")
+        # `docker compose version` only succeeds when both the docker CLI and
+        # the compose v2 plugin are present, so one probe covers both.
         subprocess.run(
-            ["docker", "--version"],
+            [DOCKER_BIN, "compose", "version"],
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
             check=True,
-            shell=(platform.system() == "Windows")
         )
         print_success("Docker is installed.")
-        
-        # Check docker compose (v2)
-        subprocess.run(
-            ["docker", "compose", "version"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            check=True,
-            shell=(platform.system() == "Windows")
-        )
         print_success("Docker Compose is installed.")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        # Surface docker's own complaint (e.g. "'compose' is not a docker command")
+        detail = (getattr(e, "stderr", None) or "").strip()
+        detail = f"      {detail}\n" if detail else ""
         print_error_and_exit(
             "Docker and/or Docker Compose are not installed.\n"
+            f"{detail}"
             "      Please install Docker Desktop (Windows/Mac) or Docker Engine (Linux)\n"
             "      from https://docs.docker.com/get-docker/ before continuing."
         )
 
 def get_runner_name() -> str:
     """Generate a default runner name based on hostname."""
-    hostname = platform.node().lower().replace(".local", "")
-    os_name = platform.system().lower()
+    hostname = HOSTNAME.lower().replace(".local", "")
+    os_name = SYSTEM.lower()
     return f"runner-{os_name}-{hostname}"
 
+# One KEY=VALUE per line; the identifier class already excludes "#" comments.
+_ENV_RE = re.compile(rb"(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$")
+
+@functools.lru_cache(maxsize=8)
+def _parse_env(path: str, mtime_ns: int, size: int) -> tuple[tuple[str, str], ...]:
+    """Parse KEY=VALUE pairs from an env file.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file is re-read while repeated lookups of an unchanged one are free.
+    """
+    data = Path(path).read_bytes()
+    return tuple((key.decode(), value.decode()) for key, value in _ENV_RE.findall(data))
+
+def load_existing_env() -> dict[str, str]:
+    """Return settings from an existing .env (re-runs), or {} if there is none."""
+    try:
+        stat = ENV_FILE.stat()
+    except OSError:
+        return {}
+    return dict(_parse_env(str(ENV_FILE), stat.st_mtime_ns, stat.st_size))
+
+def _mask(key: str, n: int = 12) -> str:
+    """Mask an API key for display, keeping only a short prefix."""
+    return f"{key[:n]}..." if len(key) > n else "***"
+
 def prompt_api_key() -> str:
     """Prompt the user for their API key."""
     print_step("Configuration")
+
+    existing_key = load_existing_env().get("SCRAPER_API_KEY", "")
+    if existing_key:
+        try:
+            keep = input(f"  Keep existing API Key ({_mask(existing_key)})? [Y/n]: ").strip().lower()
+        except (KeyboardInterrupt, EOFError):
+            print("\nSetup cancelled.")
+            sys.exit(1)
+        if keep in ("", "y", "yes"):
+            return existing_key
+
     print("  You need a Runner API Key from the BayStateApp Admin Panel.")
     print("  (Go to: Scraper Network > Runner Accounts > Create Runner)")
     print()
@@ -124,27 +190,38 @@ MAX_JOBS_BEFORE_RESTART=100
 LOG_LEVEL=INFO
 """
     try:
-        with open(ENV_FILE, "w") as f:
-            f.write(env_content)
+        ENV_FILE.write_text(env_content)
         # Try to secure the file if not on Windows
-        if platform.system() != "Windows":
-            os.chmod(ENV_FILE, 0o600)
+        if not IS_WINDOWS:
+            ENV_FILE.chmod(0o600)
         print_success(f"Created {ENV_FILE.name}")
     except Exception as e:
         print_error_and_exit(f"Failed to write .env file: {e}")
 
-def download_docker_compose():
-    """Download the production docker-compose.yml if it doesn't exist."""
+def fetch_docker_compose() -> str | None:
+    """Fetch docker-compose.yml content, or None if a local copy already exists."""
     if COMPOSE_FILE.exists():
-        print_success(f"Found existing {COMPOSE_FILE.name}")
-        return
+        return None
+    # Imported lazily: urllib.request pulls in http.client/ssl/email, which
+    # re-runs with an existing compose file never need.
+    import urllib.request
+
+    req = urllib.request.Request(DOCKER_COMPOSE_URL)
+    with urllib.request.urlopen(req, timeout=10) as response:
+        return response.read().decode('utf-8')
+
+def download_docker_compose(pending: Future[str | None] | None = None):
+    """Write the production docker-compose.yml if it doesn't exist.
 
+    ``pending`` is an in-flight fetch started earlier in ``main`` so the
+    download overlaps the interactive prompt; without it we fetch inline.
+    """
     try:
-        req = urllib.request.Request(DOCKER_COMPOSE_URL)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            content = response.read().decode('utf-8')
-            with open(COMPOSE_FILE, "w") as f:
-                f.write(content)
+        content = pending.result() if pending is not None else fetch_docker_compose()
+        if content is None:
+            print_success(f"Found existing {COMPOSE_FILE.name}")
+            return
+        COMPOSE_FILE.write_text(content)
         print_success(f"Downloaded {COMPOSE_FILE.name}")
     except Exception as e:
         print_error_and_exit(f"Failed to download docker-compose.yml: {e}")
@@ -152,21 +229,15 @@ def download_docker_compose():
 def start_docker_daemon():
     """Build the image and start the compose stack."""
     print_step("Starting the Scraper Runner daemon...")
-    print("  This will build the Docker image (this may take a few minutes).")
+    print("  The Docker image is built on first run (this may take a few minutes).")
     print()
     
     try:
-        # Build first
+        # Compose builds the image only when it is missing, so re-running the
+        # installer skips the image build and Playwright/Chromium layers.
         subprocess.run(
-            ["docker", "compose", "build"],
+            [DOCKER_BIN, "compose", "up", "-d"],
             check=True,
-            shell=(platform.system() == "Windows")
-        )
-        # Then bring it up
-        subprocess.run(
-            ["docker", "compose", "up", "-d"],
-            check=True,
-            shell=(platform.system() == "Windows")
         )
         print()
         print_success("Daemon started successfully!")
@@ -179,29 +250,21 @@ def main():
     # 1. Prereqs
     check_docker_installed()
     
-    # 2. Config
-    runner_name = get_runner_name()
-    api_key = prompt_api_key()
-    
-    # 3. Files
-    create_env_file(api_key, runner_name)
-    download_docker_compose()
+    # 2. Config (fetch the compose file while the user types their key)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        compose_future = pool.submit(fetch_docker_compose)
+        runner_name = get_runner_name()
+        api_key = prompt_api_key()
+
+        # 3. Files
+        create_env_file(api_key, runner_name)
+        download_docker_compose(compose_future)
     
     # 4. Run
     start_docker_daemon()
     
     # 5. Outro
-    print("\n" + "=" * 60)
-    print("  ✅ Installation Complete!")
-    print("=" * 60 + "\n")
-    print("  The scraper is now running in the background via Docker.")
-    print("  It will automatically connect to Vercel and poll for jobs.")
-    print()
-    print("  Useful Commands:")
-    print("    • View logs:    docker compose logs -f")
-    print("    • Stop runner:  docker compose down")
-    print("    • Update:       docker compose pull && docker compose up -d")
-    print()
+    print(OUTRO)
 
 if __name__ == "__main__":
     main()
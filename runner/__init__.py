@@ -1,181 +1,394 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from itertools import chain
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, Optional, Tuple, TypedDict, TypeVar
 
-from core.api_client import JobConfig
+import httpx
+
+from core.api_client import HTTP2_AVAILABLE, HTTP_KEEPALIVE_LIMITS, JobConfig
 from core.events import ScraperEvent, create_emitter, event_bus
 from core.settings_manager import settings
 from scrapers.ai_discovery import AIDiscoveryScraper
+from scrapers.exceptions import BrowserError
 from scrapers.executor.workflow_executor import WorkflowExecutor
 from scrapers.parser import ScraperConfigParser
 from scrapers.result_collector import ResultCollector
+from utils.scraping.playwright_browser import PlaywrightBrowserPool
+
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
 
 logger = logging.getLogger(__name__)
 
+# Parsed scraper configs keyed by a hash of their API config. Chunk workers run
+# the same scraper configs for every chunk of a job, so each is validated once.
+_PARSED_CONFIG_CACHE_SIZE = 64
+_parsed_config_cache: OrderedDict[str, Any] = OrderedDict()
+
+_T = TypeVar("_T")
+
+# Alternate selector names some configs use -> canonical field name. The
+# wrapper, if any, adapts the value to the canonical field's shape. A rename
+# only fills an empty canonical field. Most scraper configs name their image
+# selector "Image URLs".
+_FIELD_RENAMES: Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...] = (
+    ("product_name", "Name", None),
+    ("price", "Price", None),
+    ("brand", "Brand", None),
+    ("description", "Description", None),
+    ("image_url", "Images", lambda url: [url]),
+    ("Image URLs", "Images", None),
+    ("Image_URLs", "Images", None),
+    ("availability", "Availability", None),
+)
+
+
+class ScrapedEntry(TypedDict):
+    """One scraper's submitted result for a SKU (results["data"][sku][scraper]).
+
+    Price is NOT scraped - we use our own pricing.
+    """
+
+    title: Any
+    brand: Any
+    weight: Any
+    description: Any
+    images: List[str]
+    availability: Any
+    url: Optional[str]
+    scraped_at: str
+
 
 class ConfigurationError(Exception):
     pass
 
 
+_timestamp_prefix: Tuple[int, str] = (-1, "")
+
+
+def _run_event_loop(main: Coroutine[Any, Any, _T]) -> _T:
+    """Run a job's coroutine to completion on a fresh event loop, using uvloop when installed.
+
+    Jobs are I/O-bound (Playwright's driver pipe, HTTP), which is where uvloop's
+    faster transports pay off. Only the job's own loop is affected; no global
+    event loop policy is installed.
+    """
+    if HAS_UVLOOP:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+def _utc_timestamp(epoch: Optional[float] = None) -> str:
+    """ISO-8601 UTC timestamp with microseconds, formatted without a datetime object."""
+    global _timestamp_prefix
+    total_micros = time.time_ns() // 1000 if epoch is None else int(epoch * 1_000_000)
+    seconds, micros = divmod(total_micros, 1_000_000)
+    # Log lines arrive in bursts, so the formatted seconds are reused until they change
+    cached_seconds, prefix = _timestamp_prefix
+    if cached_seconds != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_prefix = (seconds, prefix)
+    return f"{prefix}.{micros:06d}Z"
+
+
 def create_log_entry(level: str, message: str) -> Dict[str, Any]:
     return {
         "level": level,
         "message": message,
-        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "timestamp": _utc_timestamp(),
     }
 
 
-def _normalize_selectors_payload(raw_selectors: Any) -> list[dict[str, Any]]:
-    """Normalize API selectors payload into list format expected by ScraperConfig."""
-    if isinstance(raw_selectors, list):
-        return raw_selectors
+def _job_log(log_buffer: List[Dict[str, Any]], level: int, msg: str, *args: Any) -> None:
+    """Log a runner message and append it to the job's log buffer as an API log entry.
 
-    # API can return an empty object for "no selectors" in some paths.
-    if raw_selectors is None or raw_selectors == {}:
-        return []
+    Entries are recorded whatever level logging is configured at, so a job's
+    API logs never depend on how the process set up its handlers.
+    """
+    message = msg % args if args else msg
+    log_buffer.append(create_log_entry(logging.getLevelName(level).lower(), message))
+    logger.log(level, "[Runner] %s", message)
+
+
+def _canonicalize_fields(extracted_data: Dict[str, Any]) -> None:
+    """Move lowercase selector fields onto their canonical names, in place."""
+    for source, target, wrap in _FIELD_RENAMES:
+        value = extracted_data.get(source)
+        if value and not extracted_data.get(target):
+            del extracted_data[source]
+            extracted_data[target] = wrap(value) if wrap else value
+
+
+@contextmanager
+def _env_override(overrides: Dict[str, Optional[str]]) -> Iterator[None]:
+    """Set the non-empty overrides in os.environ, restoring prior values on exit."""
+    applied = {key: value for key, value in overrides.items() if value}
+    previous = {key: os.environ.get(key) for key in applied}
+    os.environ.update(applied)
+    try:
+        yield
+    finally:
+        for key, old_value in previous.items():
+            if old_value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = old_value
 
-    # Backward-compat for legacy dict format: {"Field": {"selector": "..."}}
-    if isinstance(raw_selectors, dict):
-        normalized: list[dict[str, Any]] = []
-        for field_name, field_config in raw_selectors.items():
-            if not isinstance(field_config, dict):
-                continue
-            item = dict(field_config)
-            if "name" not in item and isinstance(field_name, str):
-                item["name"] = field_name
-            normalized.append(item)
-        return normalized
-
-    return []
-
-
-def _build_telemetry_from_events(events: list[ScraperEvent]) -> Dict[str, Any]:
-    steps_by_index: dict[int, dict[str, Any]] = {}
-    selectors: list[dict[str, Any]] = []
-    extractions: list[dict[str, Any]] = []
-
-    for event in events:
-        event_type = event.event_type.value
-        data = event.data or {}
-
-        if event_type in {"step.started", "step.completed", "step.failed", "step.skipped"}:
-            raw_step_data = data.get("step")
-            step_data: dict[str, Any] = raw_step_data if isinstance(raw_step_data, dict) else {}
-            raw_timing_data = data.get("timing")
-            timing_data: dict[str, Any] = raw_timing_data if isinstance(raw_timing_data, dict) else {}
-            index = step_data.get("index")
-            if not isinstance(index, int):
-                continue
 
-            existing = steps_by_index.get(
-                index,
-                {
-                    "step_index": index,
-                    "action_type": str(step_data.get("action") or "unknown"),
-                    "status": "pending",
-                    "extracted_data": {},
-                },
-            )
+def _browser_is_closed(executor: WorkflowExecutor) -> bool:
+    """True once an executor's Playwright page is gone, e.g. after a browser crash."""
+    page = getattr(executor.browser, "page", None)
+    if page is None:
+        return True
+    try:
+        return page.is_closed() is True
+    except Exception:
+        return True
 
-            action_value = step_data.get("action")
-            if isinstance(action_value, str):
-                existing["action_type"] = action_value
-
-            if event_type == "step.started":
-                existing["status"] = "running"
-                started_at = timing_data.get("started_at")
-                if isinstance(started_at, str):
-                    existing["started_at"] = started_at
-                elif isinstance(event.timestamp, str):
-                    existing["started_at"] = event.timestamp
-            elif event_type == "step.completed":
-                existing["status"] = "completed"
-                started_at = timing_data.get("started_at")
-                completed_at = timing_data.get("completed_at")
-                duration_ms = timing_data.get("duration_ms")
-                if isinstance(started_at, str):
-                    existing["started_at"] = started_at
-                if isinstance(completed_at, str):
-                    existing["completed_at"] = completed_at
-                if isinstance(duration_ms, int):
-                    existing["duration_ms"] = duration_ms
-                raw_extraction_payload = data.get("extraction")
-                extraction_payload: dict[str, Any] = raw_extraction_payload if isinstance(raw_extraction_payload, dict) else {}
-                if extraction_payload:
-                    existing["extracted_data"] = extraction_payload
-                existing["sku"] = data.get("sku")
-            elif event_type == "step.failed":
-                existing["status"] = "failed"
-                started_at = timing_data.get("started_at")
-                completed_at = timing_data.get("completed_at")
-                duration_ms = timing_data.get("duration_ms")
-                if isinstance(started_at, str):
-                    existing["started_at"] = started_at
-                if isinstance(completed_at, str):
-                    existing["completed_at"] = completed_at
-                if isinstance(duration_ms, int):
-                    existing["duration_ms"] = duration_ms
-                raw_error_payload = data.get("error")
-                error_payload: dict[str, Any] = raw_error_payload if isinstance(raw_error_payload, dict) else {}
-                if isinstance(error_payload.get("message"), str):
-                    existing["error_message"] = str(error_payload.get("message"))
-                existing["sku"] = data.get("sku")
-            elif event_type == "step.skipped":
-                existing["status"] = "skipped"
-                reason = data.get("reason")
-                if isinstance(reason, str):
-                    existing["error_message"] = reason
-                existing["sku"] = data.get("sku")
-
-            steps_by_index[index] = existing
-            continue
 
-        if event_type == "selector.resolved":
-            raw_selector_payload = data.get("selector")
-            selector_payload: dict[str, Any] = raw_selector_payload if isinstance(raw_selector_payload, dict) else {}
-            found = selector_payload.get("found") is True
-            status = "FOUND" if found else "MISSING"
-            if isinstance(selector_payload.get("error"), str):
-                status = "ERROR"
-
-            selectors.append(
-                {
-                    "sku": data.get("sku") if isinstance(data.get("sku"), str) else "",
-                    "selector_name": str(selector_payload.get("name") or "unknown"),
-                    "selector_value": str(selector_payload.get("value") or ""),
-                    "status": status,
-                    "error_message": selector_payload.get("error") if isinstance(selector_payload.get("error"), str) else None,
-                    "duration_ms": None,
-                }
-            )
-            continue
+def _load_scraper_config(parser: ScraperConfigParser, scraper_cfg: Any) -> Any:
+    """Parse an API scraper config, reusing the result for identical configs.
 
-        if event_type == "extraction.completed":
-            raw_extraction_payload = data.get("extraction")
-            extraction_payload: dict[str, Any] = raw_extraction_payload if isinstance(raw_extraction_payload, dict) else {}
-            status = str(extraction_payload.get("status") or "SUCCESS")
-            field_value = extraction_payload.get("value")
-            extractions.append(
-                {
-                    "sku": data.get("sku") if isinstance(data.get("sku"), str) else "",
-                    "field_name": str(extraction_payload.get("field_name") or "unknown"),
-                    "field_value": str(field_value) if field_value is not None else None,
-                    "status": status,
-                    "error_message": extraction_payload.get("error") if isinstance(extraction_payload.get("error"), str) else None,
-                    "duration_ms": None,
-                }
-            )
+    Callers get a deep copy of the cached config, so a job that mutates its
+    config cannot change what later jobs load.
+    """
+    key = hashlib.blake2b(json.dumps(asdict(scraper_cfg), sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+    config = _parsed_config_cache.get(key)
+    if config is not None:
+        _parsed_config_cache.move_to_end(key)
+        return config.model_copy(deep=True)
+
+    config = parser.load_from_api_config(scraper_cfg)
+    _parsed_config_cache[key] = config
+    if len(_parsed_config_cache) > _PARSED_CONFIG_CACHE_SIZE:
+        _parsed_config_cache.popitem(last=False)
+    return config.model_copy(deep=True)
+
+
+# Step indices below this are kept in a dense list while building telemetry
+_DENSE_STEP_INDEX_LIMIT = 1024
+# Most recent selector / extraction entries kept in a job's telemetry
+_TELEMETRY_MAX_ENTRIES = 1000
+
+def _apply_step_timing(step: Dict[str, Any], timing_data: Dict[str, Any]) -> None:
+    started_at = timing_data.get("started_at")
+    completed_at = timing_data.get("completed_at")
+    duration_ms = timing_data.get("duration_ms")
+    if isinstance(started_at, str):
+        step["started_at"] = started_at
+    if isinstance(completed_at, str):
+        step["completed_at"] = completed_at
+    if isinstance(duration_ms, int):
+        step["duration_ms"] = duration_ms
+
+
+def _upsert_step(data: Dict[str, Any], telemetry: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Return the telemetry step a step.* event refers to, plus its timing payload."""
+    raw_step_data = data.get("step")
+    step_data: dict[str, Any] = raw_step_data if isinstance(raw_step_data, dict) else {}
+    index = step_data.get("index")
+    if not isinstance(index, int):
+        return None
+
+    # Workflow step indices are small and dense, so they index a list directly;
+    # anything outside that range goes to a dict that is sorted at the end
+    dense_steps: List[Optional[Dict[str, Any]]] = telemetry["steps"]
+    is_dense = 0 <= index < _DENSE_STEP_INDEX_LIMIT
+    if is_dense:
+        if index >= len(dense_steps):
+            dense_steps.extend([None] * (index + 1 - len(dense_steps)))
+        existing = dense_steps[index]
+    else:
+        existing = telemetry["sparse_steps"].get(index)
+
+    action_value = step_data.get("action")
+    if existing is None:
+        existing = {
+            "step_index": index,
+            "action_type": str(action_value or "unknown"),
+            "status": "pending",
+            "extracted_data": {},
+        }
+        if is_dense:
+            dense_steps[index] = existing
+        else:
+            telemetry["sparse_steps"][index] = existing
+    elif isinstance(action_value, str):
+        existing["action_type"] = action_value
+
+    raw_timing_data = data.get("timing")
+    timing_data: dict[str, Any] = raw_timing_data if isinstance(raw_timing_data, dict) else {}
+    return existing, timing_data
+
+
+def _on_step_started(event: ScraperEvent, data: Dict[str, Any], telemetry: Dict[str, Any]) -> None:
+    found = _upsert_step(data, telemetry)
+    if found is None:
+        return
+    existing, timing_data = found
+    existing["status"] = "running"
+    started_at = timing_data.get("started_at")
+    if isinstance(started_at, str):
+        existing["started_at"] = started_at
+    elif isinstance(event.timestamp, str):
+        existing["started_at"] = event.timestamp
+
+
+def _on_step_completed(event: ScraperEvent, data: Dict[str, Any], telemetry: Dict[str, Any]) -> None:
+    found = _upsert_step(data, telemetry)
+    if found is None:
+        return
+    existing, timing_data = found
+    existing["status"] = "completed"
+    _apply_step_timing(existing, timing_data)
+    extraction_payload = data.get("extraction")
+    if isinstance(extraction_payload, dict) and extraction_payload:
+        existing["extracted_data"] = extraction_payload
+    existing["sku"] = data.get("sku")
+
+
+def _on_step_failed(event: ScraperEvent, data: Dict[str, Any], telemetry: Dict[str, Any]) -> None:
+    found = _upsert_step(data, telemetry)
+    if found is None:
+        return
+    existing, timing_data = found
+    existing["status"] = "failed"
+    _apply_step_timing(existing, timing_data)
+    error_payload = data.get("error")
+    if isinstance(error_payload, dict) and isinstance(error_payload.get("message"), str):
+        existing["error_message"] = error_payload["message"]
+    existing["sku"] = data.get("sku")
+
+
+def _on_step_skipped(event: ScraperEvent, data: Dict[str, Any], telemetry: Dict[str, Any]) -> None:
+    found = _upsert_step(data, telemetry)
+    if found is None:
+        return
+    existing, _ = found
+    existing["status"] = "skipped"
+    reason = data.get("reason")
+    if isinstance(reason, str):
+        existing["error_message"] = reason
+    existing["sku"] = data.get("sku")
+
+
+def _event_sku(data: Dict[str, Any]) -> str:
+    sku = data.get("sku")
+    return sku if isinstance(sku, str) else ""
+
+
+def _on_selector_resolved(event: ScraperEvent, data: Dict[str, Any], telemetry: Dict[str, Any]) -> None:
+    raw_selector_payload = data.get("selector")
+    selector_payload: dict[str, Any] = raw_selector_payload if isinstance(raw_selector_payload, dict) else {}
+    error = selector_payload.get("error")
+    if not isinstance(error, str):
+        error = None
+
+    if error is not None:
+        status = "ERROR"
+    elif selector_payload.get("found") is True:
+        status = "FOUND"
+    else:
+        status = "MISSING"
+
+    telemetry["selectors"].append(
+        {
+            "sku": _event_sku(data),
+            "selector_name": str(selector_payload.get("name") or "unknown"),
+            "selector_value": str(selector_payload.get("value") or ""),
+            "status": status,
+            "error_message": error,
+            "duration_ms": None,
+        }
+    )
+
+
+def _on_extraction_completed(event: ScraperEvent, data: Dict[str, Any], telemetry: Dict[str, Any]) -> None:
+    raw_extraction_payload = data.get("extraction")
+    extraction_payload: dict[str, Any] = raw_extraction_payload if isinstance(raw_extraction_payload, dict) else {}
+    field_value = extraction_payload.get("value")
+    error = extraction_payload.get("error")
+    telemetry["extractions"].append(
+        {
+            "sku": _event_sku(data),
+            "field_name": str(extraction_payload.get("field_name") or "unknown"),
+            "field_value": str(field_value) if field_value is not None else None,
+            "status": str(extraction_payload.get("status") or "SUCCESS"),
+            "error_message": error if isinstance(error, str) else None,
+            "duration_ms": None,
+        }
+    )
+
+
+# Event type value -> handler folding that event into the telemetry being built
+_TELEMETRY_HANDLERS: Dict[str, Callable[[ScraperEvent, Dict[str, Any], Dict[str, Any]], None]] = {
+    "step.started": _on_step_started,
+    "step.completed": _on_step_completed,
+    "step.failed": _on_step_failed,
+    "step.skipped": _on_step_skipped,
+    "selector.resolved": _on_selector_resolved,
+    "extraction.completed": _on_extraction_completed,
+}
+
+
+class _TelemetryReducer:
+    """Folds a job's scraper events into telemetry as they are emitted.
+
+    Subscribed to the event bus for the duration of a scrape job, so no event
+    history has to be retained and read back when the job ends. The bus calls
+    subscribers under its own lock, so folding is serialized. Step states cover
+    the whole job; selector and extraction entries keep only the most recent
+    _TELEMETRY_MAX_ENTRIES each.
+    """
 
-    ordered_steps = [steps_by_index[idx] for idx in sorted(steps_by_index.keys())]
-    return {
-        "steps": ordered_steps,
-        "selectors": selectors,
-        "extractions": extractions,
-    }
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        self._telemetry: Dict[str, Any] = {
+            "steps": [],
+            "sparse_steps": {},
+            "selectors": deque(maxlen=_TELEMETRY_MAX_ENTRIES),
+            "extractions": deque(maxlen=_TELEMETRY_MAX_ENTRIES),
+        }
+
+    def __call__(self, event: ScraperEvent) -> None:
+        if event.job_id == self.job_id:
+            self.fold(event)
+
+    def fold(self, event: ScraperEvent) -> None:
+        handler = _TELEMETRY_HANDLERS.get(event.event_type.value)
+        if handler is not None:
+            handler(event, event.data or {}, self._telemetry)
+
+    def build(self) -> Dict[str, Any]:
+        telemetry = self._telemetry
+        ordered_steps = [step for step in telemetry["steps"] if step is not None]
+        sparse_steps = telemetry["sparse_steps"]
+        if sparse_steps:
+            ordered_indices = sorted(sparse_steps)
+            ordered_steps = (
+                [sparse_steps[idx] for idx in ordered_indices if idx < 0]
+                + ordered_steps
+                + [sparse_steps[idx] for idx in ordered_indices if idx >= 0]
+            )
+        return {
+            "steps": ordered_steps,
+            "selectors": list(telemetry["selectors"]),
+            "extractions": list(telemetry["extractions"]),
+        }
 
 
 def run_job(
@@ -193,16 +406,30 @@ def run_job(
         progress_callback: Optional callback function called after each SKU is processed.
                           Signature: callback(sku: str, scraper_name: str, data: dict) -> bool
                           Should return True if progress was saved successfully.
+                          Runs on a worker thread, one call at a time.
 
     Returns:
         Dictionary with job results
     """
     del runner_name
 
+    if log_buffer is None:
+        log_buffer = []
+
+    return _run_scrape_job(job_config, log_buffer, progress_callback)
+
+
+def _run_scrape_job(
+    job_config: JobConfig,
+    log_buffer: List[Dict[str, Any]],
+    progress_callback: Optional[Callable[[str, str, dict[str, Any]], bool]],
+) -> Dict[str, Any]:
     job_id = job_config.job_id
     emitter = create_emitter(job_id)
     parser = ScraperConfigParser()
-    collector = ResultCollector(test_mode=job_config.test_mode)
+    # results["data"] is what gets submitted; the collector only needs to write
+    # the local session file, not keep a second in-memory copy of every result
+    collector = ResultCollector(test_mode=job_config.test_mode, retain_results=False)
 
     results: Dict[str, Any] = {
         "skus_processed": 0,
@@ -210,34 +437,23 @@ def run_job(
         "data": {},
     }
 
-    if log_buffer is None:
-        log_buffer = []
-
-    log_buffer.append(create_log_entry("info", f"Job {job_id} started"))
-    log_buffer.append(create_log_entry("info", f"Processing {len(job_config.skus)} SKUs with {len(job_config.scrapers)} scrapers"))
-    log_buffer.append(create_log_entry("info", f"Test mode: {job_config.test_mode}, Max workers: {job_config.max_workers}"))
-
-    logger.info(f"[Runner] Starting job {job_id}")
-    logger.info(f"[Runner] SKUs: {len(job_config.skus)}, Scrapers: {len(job_config.scrapers)}")
-    logger.info(f"[Runner] Test mode: {job_config.test_mode}, Max workers: {job_config.max_workers}")
+    _job_log(log_buffer, logging.INFO, "Starting job %s", job_id)
+    _job_log(log_buffer, logging.INFO, "SKUs: %s, Scrapers: %s", len(job_config.skus), len(job_config.scrapers))
+    _job_log(log_buffer, logging.INFO, "Test mode: %s, Max workers: %s", job_config.test_mode, job_config.max_workers)
 
     skus = job_config.skus
     if not skus and job_config.test_mode:
-        for scraper in job_config.scrapers:
-            if scraper.test_skus:
-                skus.extend(scraper.test_skus)
-        skus = list(set(skus))
-        log_buffer.append(create_log_entry("info", f"Test mode: using {len(skus)} test SKUs from job payload"))
-        logger.info(f"[Runner] Test mode: using {len(skus)} test SKUs from job payload")
+        # Order-preserving dedupe in one pass (and without mutating job_config.skus)
+        skus = list(dict.fromkeys(chain.from_iterable(scraper.test_skus for scraper in job_config.scrapers if scraper.test_skus)))
+        _job_log(log_buffer, logging.INFO, "Test mode: using %s test SKUs from job payload", len(skus))
 
     if not skus:
-        log_buffer.append(create_log_entry("warning", "No SKUs to process"))
-        logger.warning("[Runner] No SKUs to process")
+        _job_log(log_buffer, logging.WARNING, "No SKUs to process")
         results["logs"] = log_buffer
         results["telemetry"] = {"steps": [], "selectors": [], "extractions": []}
         return results
 
-    is_discovery_job = job_config.job_type == "discovery" or any(s.name == "ai_discovery" for s in job_config.scrapers)
+    is_discovery_job = job_config.job_type == "discovery" or "ai_discovery" in {s.name for s in job_config.scrapers}
     if is_discovery_job:
         return _run_discovery_job(job_config, skus, results, log_buffer)
 
@@ -246,31 +462,16 @@ def run_job(
 
     for scraper_cfg in job_config.scrapers:
         try:
-            options = scraper_cfg.options or {}
-            config_dict = {
-                "name": scraper_cfg.name,
-                "base_url": scraper_cfg.base_url,
-                "search_url_template": scraper_cfg.search_url_template,
-                "selectors": _normalize_selectors_payload(scraper_cfg.selectors),
-                "workflows": options.get("workflows", []),
-                "timeout": options.get("timeout", 30),
-                "test_skus": scraper_cfg.test_skus if scraper_cfg.test_skus is not None else [],
-                "retries": getattr(scraper_cfg, "retries", 0),
-                "validation": getattr(scraper_cfg, "validation", None),
-            }
-
-            config = parser.load_from_dict(config_dict)
+            config = _load_scraper_config(parser, scraper_cfg)
             configs.append(config)
-            log_buffer.append(create_log_entry("info", f"Loaded scraper config: {config.name}"))
-            logger.info(f"[Runner] Loaded scraper config: {config.name}")
+            _job_log(log_buffer, logging.INFO, "Loaded scraper config: %s", config.name)
         except Exception as e:
             config_errors.append((scraper_cfg.name, str(e)))
-            log_buffer.append(create_log_entry("error", f"Failed to parse config for {scraper_cfg.name}: {e}"))
-            logger.error(f"[Runner] Failed to parse config for {scraper_cfg.name}: {e}")
+            _job_log(log_buffer, logging.ERROR, "Failed to parse config for %s: %s", scraper_cfg.name, e)
 
     if config_errors:
         error_details = "; ".join([f"{name}: {err}" for name, err in config_errors])
-        log_buffer.append(create_log_entry("error", f"Configuration parsing failed for {len(config_errors)} scraper(s): {error_details}"))
+        _job_log(log_buffer, logging.ERROR, "Configuration parsing failed for %s scraper(s): %s", len(config_errors), error_details)
         raise ConfigurationError(f"[Runner] Configuration parsing failed for {len(config_errors)} scraper(s): {error_details}")
 
     if not configs:
@@ -278,142 +479,212 @@ def run_job(
             error_msg = "No scrapers specified in job configuration (missing chunks?)"
         else:
             error_msg = f"No valid scraper configurations after filtering. Original scrapers: {[s.name for s in job_config.scrapers]}"
-        log_buffer.append(create_log_entry("error", error_msg))
+        _job_log(log_buffer, logging.ERROR, "%s", error_msg)
         raise ConfigurationError(f"[Runner] {error_msg}")
 
-    for config in configs:
-        log_buffer.append(create_log_entry("info", f"Starting scraper: {config.name}"))
-        logger.info(f"[Runner] Running scraper: {config.name}")
-        results["scrapers_run"].append(config.name)
-
-        executor = None
-        try:
-            headless = settings.browser_settings["headless"]
-            if not headless:
-                logger.warning("[Runner] Running in VISIBLE mode (HEADLESS=false) - browser will be visible for debugging")
-                log_buffer.append(create_log_entry("warning", "Running in VISIBLE mode - browser will be visible"))
+    headless = settings.browser_settings["headless"]
+    if not headless:
+        _job_log(log_buffer, logging.WARNING, "Running in VISIBLE mode (HEADLESS=false) - browser will be visible for debugging")
+
+    # Progress callbacks may block (chunk workers save over HTTP with retries),
+    # so they run in order on one worker thread instead of stalling every lane
+    progress_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="progress-callback") if progress_callback else None
+
+    async def record_result(
+        config: Any,
+        sku: str,
+        result: Any,
+        browser_url: Optional[str],
+        collected: List[Tuple[str, str, Dict[str, Any]]],
+    ) -> None:
+        """Shape one finished scrape into results["data"] and report it.
+
+        The collector entry is appended to ``collected`` so each config's
+        session-file entries are written in one batch.
+        """
+        results["skus_processed"] += 1
 
-            executor = WorkflowExecutor(
+        if not result.get("success"):
+            _job_log(log_buffer, logging.WARNING, "%s/%s: Workflow failed", config.name, sku)
+            return
+
+        extracted_data = result.get("results") or {}
+
+        _canonicalize_fields(extracted_data)
+
+        # A scrape counts as having found data if any of these fields is populated
+        if not (extracted_data.get("Name") or extracted_data.get("Brand") or extracted_data.get("Weight")):
+            _job_log(log_buffer, logging.INFO, "%s/%s: No data found", config.name, sku)
+            return
+
+        # Capture the product page URL from the browser if not
+        # explicitly extracted by a "URL" selector
+        page_url = extracted_data.get("URL") or browser_url
+
+        entry: ScrapedEntry = {
+            "title": extracted_data.get("Name"),
+            "brand": extracted_data.get("Brand"),
+            "weight": extracted_data.get("Weight"),
+            "description": extracted_data.get("Description"),
+            # An "Image URLs" selector wins over "Images" when a config has both
+            "images": extracted_data.get("Image URLs") or extracted_data.get("Images") or [],
+            "availability": extracted_data.get("Availability"),
+            "url": page_url,
+            "scraped_at": _utc_timestamp(),
+        }
+        results["data"].setdefault(sku, {})[config.name] = entry
+
+        collected.append((sku, config.name, extracted_data))
+
+        # Call progress callback if provided (for incremental saving)
+        if progress_callback:
+            try:
+                await asyncio.get_running_loop().run_in_executor(progress_pool, progress_callback, sku, config.name, entry)
+            except Exception as e:
+                _job_log(log_buffer, logging.WARNING, "Progress callback failed for %s/%s: %s", config.name, sku, e)
+
+        emitter.info(f"{config.name}/{sku}: Found data", data=entry)
+        _job_log(log_buffer, logging.INFO, "%s/%s: Found data", config.name, sku)
+
+    async def scrape_config(
+        config: Any,
+        lane_count: int,
+        lane_slots: asyncio.Semaphore,
+        http_client: httpx.AsyncClient,
+        browser_pool: PlaywrightBrowserPool,
+    ) -> None:
+        # Each lane owns a WorkflowExecutor (and browser): executors keep
+        # per-run state, so they cannot be shared between concurrent SKUs.
+        lane_count = min(lane_count, len(skus))
+        executors = [
+            WorkflowExecutor(
                 config,
                 headless=headless,
                 timeout=30,
-                worker_id="API",
+                worker_id="API" if lane_count == 1 else f"API-{lane + 1}",
                 debug_mode=False,
                 job_id=job_id,
                 event_emitter=emitter,
+                http_client=http_client,
+                browser_pool=browser_pool,
             )
+            for lane in range(lane_count)
+        ]
+
+        # Shared by all lanes; the next SKU goes to whichever lane frees up first
+        pending_skus = iter(skus)
+        collected: List[Tuple[str, str, Dict[str, Any]]] = []
 
-            # Run all async operations in a single event loop to properly manage
-            # Playwright browser subprocess lifecycle
-            async def run_all_scrapes() -> List[Tuple[str, Any]]:
-                if executor is None:
-                    return []
-                scrape_results = []
+        async def scrape_sku(lane_executor: WorkflowExecutor, sku: str) -> Tuple[Any, Optional[str]]:
+            result = await lane_executor.execute_workflow(
+                context={"sku": sku, "test_mode": job_config.test_mode},
+                quit_browser=False,
+            )
+            # Read the product page URL while this lane's browser is still open
+            page_url = None
+            if lane_executor.browser:
+                try:
+                    page_url = lane_executor.browser.current_url
+                except Exception:
+                    pass
+            return result, page_url
+
+        async def run_lane(lane_executor: WorkflowExecutor) -> None:
+            # Held for the lane's whole life, from opening its browser to quitting it
+            async with lane_slots:
                 try:
-                    await executor.initialize()
-                    for sku in skus:
+                    await lane_executor.initialize()
+                    for sku in pending_skus:
                         try:
-                            result = await executor.execute_workflow(
-                                context={"sku": sku, "test_mode": job_config.test_mode},
-                                quit_browser=False,
-                            )
-                            scrape_results.append((sku, result))
+                            result, page_url = await scrape_sku(lane_executor, sku)
                         except Exception as e:
-                            log_buffer.append(create_log_entry("error", f"{config.name}/{sku}: {type(e).__name__} - {e}"))
-                            logger.error(f"[Runner] {config.name}/{sku}: Error - {e}")
-                            scrape_results.append((sku, None))
+                            _job_log(log_buffer, logging.ERROR, "%s/%s: %s - %s", config.name, sku, type(e).__name__, e)
+                            if not _browser_is_closed(lane_executor):
+                                continue
+                            # The browser died mid-SKU; a crashed shared Chromium takes every
+                            # lane's page with it. Reopen this lane's browser (the pool
+                            # relaunches Chromium if it is gone) and retry the SKU once.
+                            _job_log(log_buffer, logging.WARNING, "%s/%s: browser closed, reopening it and retrying", config.name, sku)
+                            if lane_executor.browser:
+                                await lane_executor.browser.quit()
+                            await lane_executor.initialize()
+                            try:
+                                result, page_url = await scrape_sku(lane_executor, sku)
+                            except Exception as retry_error:
+                                _job_log(log_buffer, logging.ERROR, "%s/%s: %s - %s", config.name, sku, type(retry_error).__name__, retry_error)
+                                # A browser that dies again fails every later SKU too; end this
+                                # lane and leave the remaining SKUs to lanes that still work
+                                if _browser_is_closed(lane_executor):
+                                    raise BrowserError(f"Browser closed while scraping {sku}") from retry_error
+                                continue
+
+                        # Results are shaped and reported as soon as each SKU
+                        # finishes, so progress saves happen while lanes still run
+                        try:
+                            await record_result(config, sku, result, page_url, collected)
+                        except Exception as e:
+                            _job_log(log_buffer, logging.ERROR, "Failed to process result for %s/%s: %s", config.name, sku, e)
                 finally:
                     # Ensure browser is properly quit inside the async context
-                    if executor.browser:
+                    if lane_executor.browser:
                         try:
-                            await executor.browser.quit()
+                            await lane_executor.browser.quit()
                         except Exception as e:
-                            logger.debug(f"Browser quit error: {e}")
-                return scrape_results
-
-            scrape_results = asyncio.run(run_all_scrapes())
-
-            # Process results after async loop completes
-            for sku, result in scrape_results:
-                if result is None:
-                    continue
-
-                results["skus_processed"] += 1
-
-                if result.get("success"):
-                    extracted_data = result.get("results", {})
-
-                    if extracted_data.get("product_name") and not extracted_data.get("Name"):
-                        extracted_data["Name"] = extracted_data.pop("product_name")
-                    if extracted_data.get("price") and not extracted_data.get("Price"):
-                        extracted_data["Price"] = extracted_data.pop("price")
-                    if extracted_data.get("brand") and not extracted_data.get("Brand"):
-                        extracted_data["Brand"] = extracted_data.pop("brand")
-                    if extracted_data.get("description") and not extracted_data.get("Description"):
-                        extracted_data["Description"] = extracted_data.pop("description")
-                    if extracted_data.get("image_url") and not extracted_data.get("Images"):
-                        extracted_data["Images"] = [extracted_data.pop("image_url")]
-                    if extracted_data.get("availability") and not extracted_data.get("Availability"):
-                        extracted_data["Availability"] = extracted_data.pop("availability")
-                    has_data = any(extracted_data.get(field) for field in ["Name", "Brand", "Weight"])
-
-                    if has_data:
-                        if sku not in results["data"]:
-                            results["data"][sku] = {}
-
-                        # Handle both "Images" and "Image URLs" field names
-                        # (scraper configs use "Image URLs" as the selector name)
-                        images = extracted_data.get("Images") or extracted_data.get("Image URLs") or extracted_data.get("Image_URLs") or []
-
-                        # Capture the product page URL from the browser if not
-                        # explicitly extracted by a "URL" selector
-                        page_url = extracted_data.get("URL")
-                        if not page_url and executor and executor.browser:
-                            try:
-                                page_url = executor.browser.current_url
-                            except Exception:
-                                pass
-
-                        results["data"][sku][config.name] = {
-                            # Note: Price is NOT scraped - we use our own pricing
-                            "title": extracted_data.get("Name"),
-                            "brand": extracted_data.get("Brand"),
-                            "weight": extracted_data.get("Weight"),
-                            "description": extracted_data.get("Description"),
-                            "images": extracted_data.get("Image URLs", []) or extracted_data.get("Images", []),
-                            "availability": extracted_data.get("Availability"),
-                            "url": page_url,
-                            "scraped_at": datetime.now().isoformat(),
-                        }
-
-                        collector.add_result(sku, config.name, extracted_data)
-
-                        # Call progress callback if provided (for incremental saving)
-                        if progress_callback:
-                            try:
-                                progress_callback(sku, config.name, results["data"][sku][config.name])
-                            except Exception as e:
-                                logger.warning(f"[Runner] Progress callback failed for {config.name}/{sku}: {e}")
-
-                        log_buffer.append(create_log_entry("info", f"{config.name}/{sku}: Found data"))
-                        emitter.info(f"{config.name}/{sku}: Found data", data=results["data"][sku][config.name])
-                        logger.info(f"[Runner] {config.name}/{sku}: Found data")
-                    else:
-                        log_buffer.append(create_log_entry("info", f"{config.name}/{sku}: No data found"))
-                        logger.info(f"[Runner] {config.name}/{sku}: No data found")
-                else:
-                    log_buffer.append(create_log_entry("warning", f"{config.name}/{sku}: Workflow failed"))
-                    logger.warning(f"[Runner] {config.name}/{sku}: Workflow failed")
+                            logger.debug("Browser quit error: %s", e)
+
+        lane_outcomes = await asyncio.gather(*(run_lane(lane_executor) for lane_executor in executors), return_exceptions=True)
+        collector.add_results(collected)
+        lane_errors = [outcome for outcome in lane_outcomes if isinstance(outcome, BaseException)]
+        if len(lane_errors) == len(executors):
+            raise lane_errors[0]
+        for lane_error in lane_errors:
+            _job_log(log_buffer, logging.WARNING, "%s: worker lane failed, remaining lanes continue - %s", config.name, lane_error)
+
+    # Scrapers target different sites with independent browsers, so all configs
+    # run side by side on one event loop.
+    # They share one HTTP client so actions that call APIs directly (e.g.
+    # ai_search) reuse keep-alive connections across SKUs and scrapers, and
+    # one Chromium process in which every lane opens its own browser context.
+    # max_workers caps lanes (and so browser contexts) for the whole job: the
+    # lanes are split across configs, and when there are more configs than
+    # lanes the semaphore makes the extra configs wait for a free lane.
+    async def run_all_configs() -> List[Any]:
+        max_lanes = max(1, job_config.max_workers or 1)
+        lane_slots = asyncio.Semaphore(max_lanes)
+        share, extra = divmod(max_lanes, len(configs))
+        lane_counts = [max(1, share + (index < extra)) for index in range(len(configs))]
+
+        browser_pool = PlaywrightBrowserPool(headless=headless)
+        try:
+            async with httpx.AsyncClient(timeout=30.0, http2=HTTP2_AVAILABLE, limits=HTTP_KEEPALIVE_LIMITS) as http_client:
+                return await asyncio.gather(
+                    *(scrape_config(config, lane_count, lane_slots, http_client, browser_pool) for config, lane_count in zip(configs, lane_counts)),
+                    return_exceptions=True,
+                )
+        finally:
+            await browser_pool.close()
 
-        except Exception as e:
-            log_buffer.append(create_log_entry("error", f"Failed to initialize {config.name}: {e}"))
-            logger.error(f"[Runner] Failed to initialize {config.name}: {e}")
+    for config in configs:
+        _job_log(log_buffer, logging.INFO, "Running scraper: %s", config.name)
+        results["scrapers_run"].append(config.name)
 
-    log_buffer.append(create_log_entry("info", f"Job complete. Processed {results['skus_processed']} SKUs"))
-    logger.info(f"[Runner] Job complete. Processed {results['skus_processed']} SKUs")
-    captured_events = event_bus.get_events(job_id=job_id, limit=2000)
+    telemetry_reducer = _TelemetryReducer(job_id)
+    event_bus.subscribe(telemetry_reducer)
+    try:
+        config_outcomes = _run_event_loop(run_all_configs())
+    finally:
+        event_bus.unsubscribe(telemetry_reducer)
+        if progress_pool:
+            progress_pool.shutdown()
+
+    for config, outcome in zip(configs, config_outcomes):
+        if isinstance(outcome, BaseException):
+            _job_log(log_buffer, logging.ERROR, "Scraper %s failed: %s", config.name, outcome)
+
+    _job_log(log_buffer, logging.INFO, "Job complete. Processed %s SKUs", results["skus_processed"])
+    event_bus.flush()
     results["logs"] = log_buffer
-    results["telemetry"] = _build_telemetry_from_events(captured_events)
+    results["telemetry"] = telemetry_reducer.build()
     return results
 
 
@@ -431,17 +702,6 @@ def _run_discovery_job(
     confidence_threshold = float(discovery_cfg.get("confidence_threshold", 0.7) or 0.7)
     llm_model = str(discovery_cfg.get("llm_model", "gpt-4o-mini") or "gpt-4o-mini")
 
-    previous_openai = os.environ.get("OPENAI_API_KEY")
-    previous_brave = os.environ.get("BRAVE_API_KEY")
-    runtime_credentials = job_config.ai_credentials or {}
-    runtime_openai = runtime_credentials.get("openai_api_key")
-    runtime_brave = runtime_credentials.get("brave_api_key")
-
-    if runtime_openai:
-        os.environ["OPENAI_API_KEY"] = runtime_openai
-    if runtime_brave:
-        os.environ["BRAVE_API_KEY"] = runtime_brave
-
     item_context_by_sku: Dict[str, Dict[str, Any]] = {}
 
     raw_items = discovery_cfg.get("items")
@@ -477,8 +737,7 @@ def _run_discovery_job(
             }
         )
 
-    log_buffer.append(create_log_entry("info", f"Starting discovery scraper for {len(items)} SKUs"))
-    logger.info(f"[Runner] Starting discovery job for {len(items)} SKUs")
+    _job_log(log_buffer, logging.INFO, "Starting discovery job for %s SKUs", len(items))
     results["scrapers_run"].append(scraper_name)
 
     async def _run() -> list[Any]:
@@ -491,21 +750,16 @@ def _run_discovery_job(
         )
         return await scraper.scrape_products_batch(items, max_concurrency=max_concurrency)
 
-    try:
-        batch_results = asyncio.run(_run())
-    finally:
-        if runtime_openai:
-            if previous_openai is None:
-                os.environ.pop("OPENAI_API_KEY", None)
-            else:
-                os.environ["OPENAI_API_KEY"] = previous_openai
-
-        if runtime_brave:
-            if previous_brave is None:
-                os.environ.pop("BRAVE_API_KEY", None)
-            else:
-                os.environ["BRAVE_API_KEY"] = previous_brave
+    runtime_credentials = job_config.ai_credentials or {}
+    env_overrides = {
+        "OPENAI_API_KEY": runtime_credentials.get("openai_api_key"),
+        "BRAVE_API_KEY": runtime_credentials.get("brave_api_key"),
+    }
+    with _env_override(env_overrides):
+        batch_results = _run_event_loop(_run())
 
+    # The whole batch shares one scrape timestamp
+    scraped_at = _utc_timestamp()
     for discovery in batch_results:
         sku = discovery.sku
         results["skus_processed"] += 1
@@ -526,21 +780,18 @@ def _run_discovery_job(
                 "source_website": discovery.source_website,
                 "confidence": discovery.confidence,
                 "cost_usd": discovery.cost_usd,
-                "scraped_at": datetime.now().isoformat(),
+                "scraped_at": scraped_at,
             }
-            log_buffer.append(create_log_entry("info", f"{scraper_name}/{sku}: Found data"))
-            logger.info(f"[Runner] {scraper_name}/{sku}: Found data")
+            _job_log(log_buffer, logging.INFO, "%s/%s: Found data", scraper_name, sku)
         else:
             results["data"][sku][scraper_name] = {
                 "error": discovery.error,
                 "cost_usd": discovery.cost_usd,
-                "scraped_at": datetime.now().isoformat(),
+                "scraped_at": scraped_at,
             }
-            log_buffer.append(create_log_entry("warning", f"{scraper_name}/{sku}: {discovery.error or 'Failed'}"))
-            logger.warning(f"[Runner] {scraper_name}/{sku}: {discovery.error or 'Failed'}")
+            _job_log(log_buffer, logging.WARNING, "%s/%s: %s", scraper_name, sku, discovery.error or "Failed")
 
-    log_buffer.append(create_log_entry("info", f"Discovery job complete. Processed {results['skus_processed']} SKUs"))
-    logger.info(f"[Runner] Discovery job complete. Processed {results['skus_processed']} SKUs")
+    _job_log(log_buffer, logging.INFO, "Discovery job complete. Processed %s SKUs", results["skus_processed"])
     results["logs"] = log_buffer
     results["telemetry"] = {"steps": [], "selectors": [], "extractions": []}
     return results
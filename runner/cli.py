@@ -45,18 +45,17 @@ def main() -> None:
         logger.error("No API URL provided. Set --api-url or SCRAPER_API_URL")
         sys.exit(1)
 
-    client = ScraperAPIClient(api_url=api_url, runner_name=args.runner_name)
-
-    logger.info(f"[Runner] Performing pre-flight health check against {api_url}")
-    try:
-        client.health_check()
-    except ConnectionError as e:
-        logger.error(f"[Runner] Pre-flight health check failed: {e}")
-        sys.exit(1)
-
-    if args.mode == "realtime":
-        asyncio.run(run_realtime_mode(client, args.runner_name))
-    elif args.mode == "chunk_worker":
-        run_chunk_worker_mode(client, args.job_id, args.runner_name)
-    else:
-        run_full_mode(client, args.job_id, args.runner_name)
+    with ScraperAPIClient(api_url=api_url, runner_name=args.runner_name) as client:
+        logger.info("[Runner] Performing pre-flight health check against %s", api_url)
+        try:
+            client.health_check()
+        except ConnectionError as e:
+            logger.error("[Runner] Pre-flight health check failed: %s", e)
+            sys.exit(1)
+
+        if args.mode == "realtime":
+            asyncio.run(run_realtime_mode(client, args.runner_name))
+        elif args.mode == "chunk_worker":
+            run_chunk_worker_mode(client, args.job_id, args.runner_name)
+        else:
+            run_full_mode(client, args.job_id, args.runner_name)
@@ -10,13 +10,29 @@ from utils.structured_logging import generate_trace_id
 
 from runner import run_job
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_results(obj: object, pretty: bool) -> str:
+    """Serialize results as JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if pretty else None)
+
+
 def run_full_mode(client: ScraperAPIClient, job_id: str, runner_name: str) -> None:
     trace_id = generate_trace_id()
     logger.info(
-        f"[Full Mode] Starting job {job_id}",
+        "[Full Mode] Starting job %s",
+        job_id,
         extra={"job_id": job_id, "trace_id": trace_id, "runner_name": runner_name},
     )
     client.update_status(job_id, "running", runner_name=runner_name)
@@ -49,10 +65,12 @@ def run_full_mode(client: ScraperAPIClient, job_id: str, runner_name: str) -> No
             lease_token=job_config.lease_token,
             results=results,
         )
-        print(json.dumps(results, indent=2))
+        # Indent only for humans; piped output is consumed by machines
+        print(_dumps_results(results, pretty=sys.stdout.isatty()))
     except ConfigValidationError as e:
         logger.error(
-            f"[Full Mode] Config validation failed: {e}",
+            "[Full Mode] Config validation failed: %s",
+            e,
             extra={
                 "job_id": job_id,
                 "trace_id": trace_id,
@@ -72,7 +90,8 @@ def run_full_mode(client: ScraperAPIClient, job_id: str, runner_name: str) -> No
         sys.exit(1)
     except ConfigFetchError as e:
         logger.error(
-            f"[Full Mode] Config fetch failed: {e}",
+            "[Full Mode] Config fetch failed: %s",
+            e,
             extra={
                 "job_id": job_id,
                 "trace_id": trace_id,
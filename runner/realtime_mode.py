@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import Any
@@ -14,6 +15,13 @@ from runner import run_job
 
 logger = logging.getLogger(__name__)
 
+# Scraper system events relayed to the job log, mapped to their log level
+_EVENT_LOG_LEVELS = {
+    "system.info": "info",
+    "system.warning": "warning",
+    "system.error": "error",
+}
+
 
 async def run_realtime_mode(client: ScraperAPIClient, runner_name: str) -> None:
     supabase_config = client.get_supabase_config()
@@ -35,7 +43,9 @@ async def run_realtime_mode(client: ScraperAPIClient, runner_name: str) -> None:
 
     realtime_trace_id = generate_trace_id()
     logger.info(
-        f"[Realtime Runner] Starting with runner name: {runner_name} ({config_source})",
+        "[Realtime Runner] Starting with runner name: %s (%s)",
+        runner_name,
+        config_source,
         extra={"runner_name": runner_name, "trace_id": realtime_trace_id},
     )
 
@@ -67,7 +77,8 @@ async def run_realtime_mode(client: ScraperAPIClient, runner_name: str) -> None:
         lease_token: str | None = None
 
         logger.info(
-            f"[Realtime Runner] Received job: {job_id}",
+            "[Realtime Runner] Received job: %s",
+            job_id,
             extra={
                 "job_id": job_id,
                 "runner_name": runner_name,
@@ -115,29 +126,21 @@ async def run_realtime_mode(client: ScraperAPIClient, runner_name: str) -> None:
                 if event.job_id != job_id:
                     return
                 # We want to capture the SYSTEM_INFO events that carry our product data details
-                if event.event_type.value in ("system.info", "system.warning", "system.error"):
+                if event.event_type.value in _EVENT_LOG_LEVELS:
                     try:
-                        import asyncio
-                        
-                        level_map = {
-                            "system.info": "info",
-                            "system.warning": "warning",
-                            "system.error": "error"
-                        }
-                        
-                        # Only broadcast if there are actual details to share, 
+                        # Only broadcast if there are actual details to share,
                         # to avoid duplicating the standard logger info messages already being sent elsewhere
                         if event.data:
                             asyncio.create_task(
                                 rm.broadcast_job_log(
                                     job_id=job_id, 
-                                    level=level_map.get(event.event_type.value, "info"), 
+                                    level=_EVENT_LOG_LEVELS[event.event_type.value], 
                                     message=event.data.get("message", "Product data found"), 
                                     details=event.data
                                 )
                             )
                     except Exception as e:
-                        logger.error(f"[Realtime Runner] Failed to handle event payload: {e}")
+                        logger.error("[Realtime Runner] Failed to handle event payload: %s", e)
 
             event_bus.subscribe(_on_scraper_event)
             
@@ -190,7 +193,8 @@ async def run_realtime_mode(client: ScraperAPIClient, runner_name: str) -> None:
             )
         except Exception as e:
             logger.exception(
-                f"[Realtime Runner] Job {job_id} failed with error",
+                "[Realtime Runner] Job %s failed with error",
+                job_id,
                 extra={"job_id": job_id, "runner_name": runner_name, "trace_id": realtime_trace_id, "job_trace_id": job_trace_id},
             )
             if rm.is_connected:
@@ -205,16 +209,12 @@ async def run_realtime_mode(client: ScraperAPIClient, runner_name: str) -> None:
             )
 
     def on_job(job_data: dict[str, Any]) -> None:
-        import asyncio
-
         asyncio.create_task(handle_job(job_data))
 
     await rm.subscribe_to_jobs(on_job)
     logger.info("[Realtime Runner] Waiting for jobs... Press Ctrl+C to stop", extra={"runner_name": runner_name, "trace_id": realtime_trace_id})
 
     try:
-        import asyncio
-
         await asyncio.Future()
     except KeyboardInterrupt:
         logger.info("[Realtime Runner] Interrupted, shutting down...", extra={"runner_name": runner_name, "trace_id": realtime_trace_id})
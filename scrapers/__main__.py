@@ -36,7 +36,8 @@ def get_test_skus_from_configs(scrapers: list[str] | None = None) -> tuple[list[
     """
 
     config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs")
-    all_skus = set()
+    # dict keys act as an insertion-ordered set, so SKUs stay grouped by config
+    all_skus: dict[str, None] = {}
     used_scrapers = []
 
     for filename in os.listdir(config_dir):
@@ -56,7 +57,7 @@ def get_test_skus_from_configs(scrapers: list[str] | None = None) -> tuple[list[
 
             test_skus = config.get("test_skus", [])
             if test_skus:
-                all_skus.update(test_skus)
+                all_skus.update(dict.fromkeys(test_skus))
                 used_scrapers.append(scraper_name)
                 print(f"  [OK] {scraper_name}: {len(test_skus)} test SKUs")
         except Exception as e:
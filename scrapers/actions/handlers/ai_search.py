@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Union, cast
 from urllib.parse import urlparse
 
@@ -106,11 +108,12 @@ class AISearchAction(BaseAIAction):
 
         for attempt in range(1, retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with self._http_client() as client:
                     response = await client.get(
                         self.BRAVE_API_URL,
                         headers=headers,
                         params=request_params,
+                        timeout=30.0,
                     )
                     _ = response.raise_for_status()
                     payload_obj = self._parse_response_json(response)
@@ -160,6 +163,16 @@ class AISearchAction(BaseAIAction):
 
         return []
 
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the executor's shared client, or a one-off client when there is none."""
+        shared_client = getattr(self.ctx, "http_client", None)
+        if shared_client is not None:
+            yield shared_client
+            return
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            yield client
+
     def _score_results(
         self,
         results: SearchResultList,
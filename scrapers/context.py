@@ -19,6 +19,7 @@ class ScraperContext(Protocol):
     # Browser interface
     browser: Any  # Has .page attribute
     ai_browser: Any
+    http_client: Any | None  # Shared httpx.AsyncClient, when the caller provides one
 
     async def find_element_safe(self, selector: str, required: bool = True, timeout: int | None = None) -> Any: ...
 
@@ -65,6 +65,8 @@ class WorkflowExecutor:
         job_id: str | None = None,
         event_emitter: Any | None = None,
         debug_callback: Any | None = None,
+        http_client: Any | None = None,
+        browser_pool: Any | None = None,
     ) -> None:
         """
         Initialize the workflow executor.
@@ -77,6 +79,9 @@ class WorkflowExecutor:
             max_retries: Override default max retries (uses config.retries if None)
             worker_id: Optional identifier for the worker (used for profile isolation)
             stop_event: Optional threading.Event to check for cancellation
+            http_client: Optional shared httpx.AsyncClient for actions that call HTTP APIs directly
+            browser_pool: Optional PlaywrightBrowserPool; the executor then opens a context
+                on the pooled Chromium instead of launching its own
         """
         self.config = config
         self.headless = headless
@@ -87,6 +92,9 @@ class WorkflowExecutor:
         self.job_id = job_id
         self.event_emitter = event_emitter
         self.debug_callback = debug_callback
+        # Owned by the caller, which keeps it open across SKUs so connections are reused
+        self.http_client = http_client
+        self.browser_pool = browser_pool
         self.settings = SettingsManager()
         self.scraper_type = getattr(config, "scraper_type", "static")
 
@@ -197,6 +205,7 @@ class WorkflowExecutor:
                     headless=self.headless,
                     profile_suffix=profile_suffix,
                     timeout=self.timeout,
+                    browser_pool=self.browser_pool,
                 )
             else:
                 raise BrowserError("Unsupported browser backend.")
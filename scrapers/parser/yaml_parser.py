@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml  # type: ignore
 
 from core.anti_detection_manager import AntiDetectionConfig
+from core.api_client import _normalize_selectors_payload
 from scrapers.models import ScraperConfig, ValidationConfig
 from scrapers.schemas import validate_config_dict
 
+if TYPE_CHECKING:
+    from core.api_client import ScraperConfig as ApiScraperConfig
+
+# libyaml's C loader parses several times faster; fall back to pure Python
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ScraperConfigParser:
     """Parser for YAML-based scraper configurations."""
@@ -51,7 +59,7 @@ class ScraperConfigParser:
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
         with open(file_path, encoding="utf-8") as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=_SafeLoader)
 
         # Preprocess anti_detection field if present
         config_dict = self._preprocess_config_dict(config_dict)
@@ -71,7 +79,7 @@ class ScraperConfigParser:
             yaml.YAMLError: If the YAML is malformed
             ValidationError: If the configuration doesn't match the schema
         """
-        config_dict = yaml.safe_load(yaml_string)
+        config_dict = yaml.load(yaml_string, Loader=_SafeLoader)
         return self.load_from_dict(config_dict)
 
     def load_from_dict(self, config_dict: dict) -> ScraperConfig:
@@ -90,6 +98,38 @@ class ScraperConfigParser:
         config_dict = self._preprocess_config_dict(config_dict)
         return validate_config_dict(config_dict)
 
+    def load_from_api_config(self, api_config: ApiScraperConfig) -> ScraperConfig:
+        """Load and parse a scraper configuration received from the coordinator API.
+
+        Reads the API config object's attributes directly instead of requiring
+        callers to assemble an intermediate dict.
+
+        Args:
+            api_config: core.api_client.ScraperConfig; its dataclass defaults cover
+                any field the API omitted
+
+        Returns:
+            Parsed ScraperConfig object
+
+        Raises:
+            ValidationError: If the configuration doesn't match the schema
+        """
+        options = api_config.options or {}
+        test_skus = api_config.test_skus
+        return self.load_from_dict(
+            {
+                "name": api_config.name,
+                "base_url": api_config.base_url,
+                "search_url_template": api_config.search_url_template,
+                "selectors": _normalize_selectors_payload(api_config.selectors),
+                "workflows": options.get("workflows", []),
+                "timeout": options.get("timeout", 30),
+                "test_skus": test_skus if test_skus is not None else [],
+                "retries": api_config.retries,
+                "validation": api_config.validation,
+            }
+        )
+
     def save_to_file(self, config: ScraperConfig, file_path: str | Path) -> None:
         """Save a ScraperConfig to a YAML file.
 
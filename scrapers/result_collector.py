@@ -22,10 +22,13 @@ logger = logging.getLogger(__name__)
 class ResultCollector:
     """Collects scraper results in memory for API submission."""
 
-    def __init__(self, output_dir: str | None = None, test_mode: bool = False) -> None:
+    def __init__(self, output_dir: str | None = None, test_mode: bool = False, retain_results: bool = True) -> None:
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.results: dict[str, dict[str, Any]] = {}
         self.test_mode = test_mode
+        # Callers that already hold the results themselves (e.g. the API runner)
+        # can skip the in-memory copy and only keep the local session file.
+        self.retain_results = retain_results
 
         if output_dir:
             self._output_dir = Path(output_dir)
@@ -36,7 +39,8 @@ class ResultCollector:
         self._output_dir.mkdir(parents=True, exist_ok=True)
         self._local_json_path: Path | None = None
 
-    def _save_result_to_local(self, sku: str, scraper_name: str, data: dict) -> None:
+    def _save_results_to_local(self, entries: list[tuple[str, str, dict]]) -> None:
+        """Merge entries into the session file with one read and one write."""
         if self._local_json_path is None:
             self._local_json_path = self._output_dir / f"session_{self.session_id}.json"
 
@@ -48,71 +52,107 @@ class ResultCollector:
             except json.JSONDecodeError:
                 pass
 
-        if scraper_name not in existing_data["results"]:
-            existing_data["results"][scraper_name] = {}
-        existing_data["results"][scraper_name][sku] = {
-            "data": data,
-            "timestamp": datetime.now().isoformat(),
-        }
+        timestamp = datetime.now().isoformat()
+        for sku, scraper_name, data in entries:
+            existing_data["results"].setdefault(scraper_name, {})[sku] = {
+                "data": data,
+                "timestamp": timestamp,
+            }
 
         with open(self._local_json_path, "w") as f:
             json.dump(existing_data, f, indent=2, default=str)
 
-    def add_result(
+    def _prepare_result(
         self,
         sku: str,
         scraper_name: str,
         result_data: dict[str, Any] | RawScrapedProduct,
-        image_quality: int = 50,
-    ) -> None:
+        image_quality: int,
+    ) -> dict[str, Any] | None:
+        """Convert a result to its DB dict and keep it in memory; None if it has no data."""
         from core.models import RawScrapedProduct
 
-        try:
-            timestamp = datetime.now().isoformat()
-
-            if isinstance(result_data, dict):
-                images = result_data.get("Images") or result_data.get("Image URLs") or result_data.get("Image_URLs") or []
-                product = RawScrapedProduct(
-                    sku=sku,
-                    source=scraper_name,
-                    name=result_data.get("Name"),
-                    brand=result_data.get("Brand"),
-                    weight=result_data.get("Weight"),
-                    description=result_data.get("Description"),
-                    images=images,
-                    category=result_data.get("Category"),
-                    product_type=result_data.get("ProductType"),
-                    scraped_price=result_data.get("Price"),
-                    image_quality=image_quality,
-                )
-                data_for_db = product.to_db_dict()
-            else:
-                product = result_data
-                data_for_db = product.to_db_dict()
-
-            has_data = any(data_for_db.get(field) for field in ["Name", "Brand", "ScrapedPrice", "Weight"])
-
-            if not has_data:
-                logger.debug(f"No data found for {sku} from {scraper_name}")
-                return
+        if isinstance(result_data, dict):
+            images = result_data.get("Images") or result_data.get("Image URLs") or result_data.get("Image_URLs") or []
+            product = RawScrapedProduct(
+                sku=sku,
+                source=scraper_name,
+                name=result_data.get("Name"),
+                brand=result_data.get("Brand"),
+                weight=result_data.get("Weight"),
+                description=result_data.get("Description"),
+                images=images,
+                category=result_data.get("Category"),
+                product_type=result_data.get("ProductType"),
+                scraped_price=result_data.get("Price"),
+                image_quality=image_quality,
+            )
+            data_for_db = product.to_db_dict()
+        else:
+            product = result_data
+            data_for_db = product.to_db_dict()
+
+        has_data = any(data_for_db.get(field) for field in ["Name", "Brand", "ScrapedPrice", "Weight"])
+
+        if not has_data:
+            logger.debug(f"No data found for {sku} from {scraper_name}")
+            return None
 
+        if self.retain_results:
             if scraper_name not in self.results:
                 self.results[scraper_name] = {}
 
             self.results[scraper_name][sku] = {
                 "sku": sku,
                 "scraper": scraper_name,
-                "timestamp": timestamp,
+                "timestamp": datetime.now().isoformat(),
                 "data": data_for_db,
                 "image_quality": product.image_quality,
             }
 
-            if not self.test_mode:
-                self._save_result_to_local(sku, scraper_name, data_for_db)
+        return data_for_db
+
+    def add_result(
+        self,
+        sku: str,
+        scraper_name: str,
+        result_data: dict[str, Any] | RawScrapedProduct,
+        image_quality: int = 50,
+    ) -> None:
+        try:
+            data_for_db = self._prepare_result(sku, scraper_name, result_data, image_quality)
+            if data_for_db is not None and not self.test_mode:
+                self._save_results_to_local([(sku, scraper_name, data_for_db)])
 
         except Exception as e:
             logger.error(f"Error processing result: {e}")
 
+    def add_results(
+        self,
+        results: list[tuple[str, str, dict[str, Any] | RawScrapedProduct]],
+        image_quality: int = 50,
+    ) -> None:
+        """Add many (sku, scraper_name, result_data) results, writing the session file once.
+
+        add_result rewrites the whole session file per call, which grows
+        quadratically over a large batch.
+        """
+        to_save: list[tuple[str, str, dict]] = []
+        for sku, scraper_name, result_data in results:
+            try:
+                data_for_db = self._prepare_result(sku, scraper_name, result_data, image_quality)
+            except Exception as e:
+                logger.error(f"Error processing result: {e}")
+                continue
+            if data_for_db is not None:
+                to_save.append((sku, scraper_name, data_for_db))
+
+        if to_save and not self.test_mode:
+            try:
+                self._save_results_to_local(to_save)
+            except Exception as e:
+                logger.error(f"Error saving results: {e}")
+
     def save_session(self, metadata: dict[str, Any] | None = None) -> str:
         if self.test_mode:
             logger.info("Test mode: Skipping session save to disk")
@@ -289,7 +289,7 @@ def run_scraping(
     # Execute scraping
     total_operations = 0
     for config in configs:
-        scraper_skus = skus if skus else (config.test_skus if test_mode and hasattr(config, "test_skus") and config.test_skus else [])
+        scraper_skus = skus or (config.test_skus if test_mode else None) or []
         total_operations += len(scraper_skus)
 
     completed_operations = 0
@@ -386,7 +386,7 @@ def run_scraping(
         sku_queue: Queue = Queue()
 
         # In test mode with no provided SKUs, use scraper's configured test_skus
-        scraper_skus = skus if skus else (config.test_skus if test_mode and hasattr(config, "test_skus") and config.test_skus else [])
+        scraper_skus = skus or (config.test_skus if test_mode else None) or []
 
         if not scraper_skus:
             log(f"{config.name}: No SKUs to process (no input SKUs and no test_skus configured)", "WARNING")
@@ -528,13 +528,7 @@ def run_scraping(
             )
         except Exception as e:
             log(f"{prefix} Failed to initialize: {e}", "ERROR")
-            if executor and hasattr(executor, "browser") and executor.browser:
-                # Cleanup if partially initialized
-                try:
-                    # We can't await here, so we rely on GC or loop cleanup
-                    pass
-                except:
-                    pass
+            # A partially initialized browser is quit by the cleanup at the end of this worker.
             # We continue to the barrier to not block other workers
 
         # Wait for all workers to be ready
@@ -906,10 +900,10 @@ def run_scraping(
 
         # Cleanup browser for this scraper
         try:
-            if executor and executor.browser and loop:
+            if executor is not None and executor.browser is not None and loop is not None:
                 loop.run_until_complete(executor.browser.quit())
             # Close loop
-            if loop:
+            if loop is not None:
                 loop.close()
         except Exception as e:
             log(f"Error closing browser: {e}", "WARNING")
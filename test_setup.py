@@ -11,6 +11,7 @@ Usage:
     python test_setup.py
 """
 
+import importlib.util
 import sys
 import os
 
@@ -26,6 +27,11 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _mask(key: str, n: int = 12) -> str:
+    """Mask an API key for display, keeping only a short prefix."""
+    return f"{key[:n]}..." if len(key) > n else "***"
+
+
 def test_python_version():
     """Test Python version compatibility."""
     print("[Python Version]")
@@ -55,10 +61,10 @@ def test_dependencies():
 
     all_ok = True
     for package, import_name in required:
-        try:
-            __import__(import_name)
+        # find_spec locates the package without importing it (or raising)
+        if importlib.util.find_spec(import_name) is not None:
             print(f"  OK: {package}")
-        except ImportError:
+        else:
             print(f"  FAIL: {package} (missing)")
             all_ok = False
 
@@ -84,7 +90,7 @@ def test_api_client():
         print("  WARN: SCRAPER_API_KEY not set")
         return False
 
-    print(f"  OK: SCRAPER_API_KEY: {api_key[:10]}...")
+    print(f"  OK: SCRAPER_API_KEY: {_mask(api_key)}")
 
     return True
 
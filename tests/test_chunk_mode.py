@@ -1,5 +1,8 @@
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from core.api_client import ClaimedChunk, JobConfig, ScraperConfig
 from runner.chunk_mode import run_chunk_worker_mode
 
@@ -73,3 +76,67 @@ def test_chunk_worker_fails_chunk_when_filter_resolves_to_zero_scrapers() -> Non
     assert args[0] == "chunk-1"
     assert args[1] == "failed"
     assert "resolved to zero scrapers" in str(client.submit_chunk_results.call_args.kwargs.get("error_message", ""))
+
+
+def test_chunk_worker_saves_progress_for_every_sku() -> None:
+    client = MagicMock()
+    client.get_job_config.return_value = _make_job_config()
+    client.claim_chunk.side_effect = [
+        ClaimedChunk(
+            chunk_id="chunk-1",
+            job_id="job-123",
+            chunk_index=0,
+            skus=["SKU-1", "SKU-2", "SKU-3"],
+            scrapers=["amazon"],
+        ),
+        None,
+    ]
+
+    def fake_run_job(job_config, runner_name=None, progress_callback=None):
+        _ = runner_name
+        for sku in job_config.skus:
+            progress_callback(sku, "amazon", {"title": sku})
+        return {"data": {}, "skus_processed": len(job_config.skus)}
+
+    with patch("runner.chunk_mode.run_job", side_effect=fake_run_job):
+        run_chunk_worker_mode(client, "job-123", "runner-1")
+
+    assert [call.args[1] for call in client.submit_chunk_progress.call_args_list] == ["SKU-1", "SKU-2", "SKU-3"]
+    final_results = client.submit_chunk_results.call_args.kwargs["results"]
+    assert set(final_results["data"]) == {"SKU-1", "SKU-2", "SKU-3"}
+
+
+def test_chunk_worker_releases_prefetched_claim_when_interrupted() -> None:
+    client = MagicMock()
+    client.get_job_config.return_value = _make_job_config()
+    prefetched = threading.Event()
+    claims = iter(
+        [
+            ClaimedChunk(chunk_id="chunk-1", job_id="job-123", chunk_index=0, skus=["SKU-1"], scrapers=["amazon"]),
+            ClaimedChunk(chunk_id="chunk-2", job_id="job-123", chunk_index=1, skus=["SKU-2"], scrapers=["amazon"]),
+        ]
+    )
+
+    def claim_chunk(job_id=None, runner_name=None):
+        _ = job_id, runner_name
+        chunk = next(claims)
+        if chunk.chunk_id == "chunk-2":
+            prefetched.set()
+        return chunk
+
+    def submit_chunk_results(chunk_id, status, results=None, error_message=None):
+        _ = results, error_message
+        if chunk_id == "chunk-1" and status == "completed":
+            prefetched.wait(timeout=2)
+            raise KeyboardInterrupt
+        return True
+
+    client.claim_chunk.side_effect = claim_chunk
+    client.submit_chunk_results.side_effect = submit_chunk_results
+
+    with patch("runner.chunk_mode.run_job", return_value={"data": {}, "skus_processed": 1}), pytest.raises(KeyboardInterrupt):
+        run_chunk_worker_mode(client, "job-123", "runner-1")
+
+    released = client.submit_chunk_results.call_args
+    assert released.args == ("chunk-2", "failed")
+    assert "stopped before processing" in released.kwargs["error_message"]
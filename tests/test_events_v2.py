@@ -656,3 +656,23 @@ class TestEventSchemaCompliance:
         assert "step" in event.data
         assert event.data["step"]["index"] == 0
         assert event.data["step"]["action"] == "navigate"
+
+
+def test_persisted_events_are_written_one_complete_line_at_a_time(tmp_path):
+    """Persisted events share one open file, and each line is on disk as soon as it is emitted."""
+    from core.events import EventBus, EventType, ScraperEvent
+
+    persist_path = tmp_path / "events" / "events.jsonl"
+    bus = EventBus(buffer_size=10, persist_path=persist_path)
+
+    for index in range(3):
+        bus.emit(ScraperEvent(event_type=EventType.SYSTEM_INFO, job_id="job-1", data={"index": index}))
+        lines = persist_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["data"]["index"] for line in lines] == list(range(index + 1))
+
+    bus.close()
+    bus.emit(ScraperEvent(event_type=EventType.SYSTEM_INFO, job_id="job-1", data={"index": 3}))
+    bus.close()
+
+    lines = persist_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["data"]["index"] for line in lines] == [0, 1, 2, 3]
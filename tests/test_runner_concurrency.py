@@ -0,0 +1,353 @@
+"""Tests for concurrent SKU processing in run_job."""
+
+import asyncio
+import logging
+import threading
+from unittest.mock import MagicMock, patch
+
+from core.api_client import JobConfig, ScraperConfig
+from runner import run_job
+
+
+def _make_job(skus: list[str], max_workers: int) -> JobConfig:
+    return JobConfig(
+        job_id="test-job-lanes",
+        skus=skus,
+        scrapers=[
+            ScraperConfig(
+                name="lane-scraper",
+                base_url="https://example.com",
+                search_url_template="https://example.com/search?q={sku}",
+                selectors=[],
+                options={},
+                test_skus=[],
+            )
+        ],
+        test_mode=True,
+        max_workers=max_workers,
+    )
+
+
+def _executor_class(scrape):
+    """Stub WorkflowExecutor whose execute_workflow returns ``await scrape(executor, sku)``."""
+
+    class StubWorkflowExecutor:
+        instances: list = []
+        initializations = 0
+
+        def __init__(self, *args, worker_id=None, event_emitter=None, **kwargs):
+            _ = args, kwargs
+            self.worker_id = worker_id
+            self.event_emitter = event_emitter
+            self.browser = None
+            StubWorkflowExecutor.instances.append(self)
+
+        async def initialize(self):
+            StubWorkflowExecutor.initializations += 1
+            self.browser = MagicMock()
+            self.browser.quit = MagicMock(side_effect=lambda: asyncio.sleep(0))
+            self.browser.page.is_closed.return_value = False
+
+        async def execute_workflow(self, context=None, quit_browser=False):
+            _ = quit_browser
+            return await scrape(self, context["sku"])
+
+    return StubWorkflowExecutor
+
+
+async def _found(executor, sku: str) -> dict:
+    executor.browser.current_url = f"https://example.com/p/{sku}"
+    return {"success": True, "results": {"Name": f"Product {sku}"}}
+
+
+def _tracking_concurrency(active: dict):
+    async def scrape(executor, sku: str) -> dict:
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return await _found(executor, sku)
+
+    return scrape
+
+
+def _crash_browser(executor) -> None:
+    executor.browser.page.is_closed.return_value = True
+    raise RuntimeError("Target page, context or browser has been closed")
+
+
+def test_skus_are_spread_across_max_workers_lanes() -> None:
+    active = {"now": 0, "peak": 0}
+    executor_class = _executor_class(_tracking_concurrency(active))
+    job_config = _make_job(["SKU1", "SKU2", "SKU3", "SKU4"], max_workers=2)
+
+    with patch("runner.WorkflowExecutor", executor_class):
+        results = run_job(job_config, runner_name="test-runner")
+
+    assert len(executor_class.instances) == 2
+    assert active["peak"] == 2
+    assert results["skus_processed"] == 4
+    assert list(results["data"]) == ["SKU1", "SKU2", "SKU3", "SKU4"]
+    assert results["data"]["SKU3"]["lane-scraper"]["url"] == "https://example.com/p/SKU3"
+
+
+def test_lane_count_never_exceeds_sku_count() -> None:
+    executor_class = _executor_class(_found)
+    job_config = _make_job(["SKU1"], max_workers=5)
+
+    with patch("runner.WorkflowExecutor", executor_class):
+        results = run_job(job_config, runner_name="test-runner")
+
+    assert len(executor_class.instances) == 1
+    assert results["skus_processed"] == 1
+
+
+def _other_scraper(name: str) -> ScraperConfig:
+    return ScraperConfig(
+        name=name,
+        base_url="https://example.org",
+        search_url_template="https://example.org/search?q={sku}",
+        selectors=[],
+        options={},
+        test_skus=[],
+    )
+
+
+def test_scraper_configs_run_side_by_side() -> None:
+    active = {"now": 0, "peak": 0}
+    executor_class = _executor_class(_tracking_concurrency(active))
+    job_config = _make_job(["SKU1", "SKU2"], max_workers=2)
+    job_config.scrapers.append(_other_scraper("other-scraper"))
+
+    with patch("runner.WorkflowExecutor", executor_class):
+        results = run_job(job_config, runner_name="test-runner")
+
+    assert len(executor_class.instances) == 2
+    assert active["peak"] == 2
+    assert results["scrapers_run"] == ["lane-scraper", "other-scraper"]
+    assert set(results["data"]["SKU2"]) == {"lane-scraper", "other-scraper"}
+
+
+def test_max_workers_caps_lanes_across_all_scraper_configs() -> None:
+    active = {"now": 0, "peak": 0}
+    executor_class = _executor_class(_tracking_concurrency(active))
+    job_config = _make_job(["SKU1", "SKU2", "SKU3"], max_workers=2)
+    job_config.scrapers += [_other_scraper("second-scraper"), _other_scraper("third-scraper")]
+
+    with patch("runner.WorkflowExecutor", executor_class):
+        results = run_job(job_config, runner_name="test-runner")
+
+    assert len(executor_class.instances) == 3
+    assert active["peak"] == 2
+    assert results["skus_processed"] == 9
+    assert set(results["data"]["SKU3"]) == {"lane-scraper", "second-scraper", "third-scraper"}
+
+
+def test_runner_log_records_fill_the_job_log_buffer(caplog) -> None:
+    job_config = _make_job(["SKU1"], max_workers=1)
+
+    with caplog.at_level(logging.INFO, logger="runner"), patch("runner.WorkflowExecutor", _executor_class(_found)):
+        results = run_job(job_config, runner_name="test-runner")
+
+    entries = {entry["message"]: entry for entry in results["logs"]}
+    assert entries["lane-scraper/SKU1: Found data"]["level"] == "info"
+    assert entries["lane-scraper/SKU1: Found data"]["timestamp"].endswith("Z")
+    assert "Job complete. Processed 1 SKUs" in entries
+    assert "[Runner] lane-scraper/SKU1: Found data" in caplog.messages
+
+
+def test_job_log_buffer_is_filled_when_logging_is_left_at_warning() -> None:
+    job_config = _make_job(["SKU1"], max_workers=1)
+    root = logging.getLogger()
+    runner_logger = logging.getLogger("runner")
+    printed: list[logging.LogRecord] = []
+    console = logging.Handler()
+    console.emit = printed.append
+    previous_root_level, previous_runner_level = root.level, runner_logger.level
+    root.setLevel(logging.WARNING)
+    runner_logger.setLevel(logging.NOTSET)
+    root.addHandler(console)
+    try:
+        with patch("runner.WorkflowExecutor", _executor_class(_found)):
+            results = run_job(job_config, runner_name="test-runner")
+        level_after_job = runner_logger.level
+    finally:
+        root.removeHandler(console)
+        root.setLevel(previous_root_level)
+        runner_logger.setLevel(previous_runner_level)
+
+    messages = [entry["message"] for entry in results["logs"]]
+    assert "lane-scraper/SKU1: Found data" in messages
+    assert "Job complete. Processed 1 SKUs" in messages
+    assert not [record for record in printed if record.name == "runner" and record.levelno < logging.WARNING]
+    assert level_after_job == logging.NOTSET
+    assert not runner_logger.filters
+
+
+def test_lane_with_crashed_browser_hands_remaining_skus_to_other_lanes() -> None:
+    attempts: dict[str, list[str]] = {}
+
+    async def scrape(executor, sku: str) -> dict:
+        attempts.setdefault(executor.worker_id, []).append(sku)
+        await asyncio.sleep(0.01)
+        if executor.worker_id == "API-1":
+            _crash_browser(executor)
+        return await _found(executor, sku)
+
+    job_config = _make_job(["SKU1", "SKU2", "SKU3", "SKU4"], max_workers=2)
+
+    with patch("runner.WorkflowExecutor", _executor_class(scrape)):
+        results = run_job(job_config, runner_name="test-runner")
+
+    # The crashed lane reopens its browser once, retries, then gives up
+    assert attempts["API-1"] == ["SKU1", "SKU1"]
+    assert attempts["API-2"] == ["SKU2", "SKU3", "SKU4"]
+    assert list(results["data"]) == ["SKU2", "SKU3", "SKU4"]
+
+
+def test_sku_in_flight_when_the_browser_crashes_is_retried_on_a_reopened_browser() -> None:
+    attempts: list[str] = []
+
+    async def scrape(executor, sku: str) -> dict:
+        attempts.append(sku)
+        if len(attempts) == 2:
+            _crash_browser(executor)
+        return await _found(executor, sku)
+
+    executor_class = _executor_class(scrape)
+    job_config = _make_job(["SKU1", "SKU2", "SKU3"], max_workers=1)
+
+    with patch("runner.WorkflowExecutor", executor_class):
+        results = run_job(job_config, runner_name="test-runner")
+
+    assert attempts == ["SKU1", "SKU2", "SKU2", "SKU3"]
+    assert executor_class.initializations == 2
+    assert list(results["data"]) == ["SKU1", "SKU2", "SKU3"]
+
+
+def test_selector_aliases_are_canonicalized_before_shaping() -> None:
+    from runner import _canonicalize_fields
+
+    extracted = {"product_name": "Chew Toy", "Image URLs": ["https://example.com/a.jpg"], "Brand": "Acme", "brand": "ignored"}
+    _canonicalize_fields(extracted)
+
+    assert extracted == {"Name": "Chew Toy", "Images": ["https://example.com/a.jpg"], "Brand": "Acme", "brand": "ignored"}
+
+    single = {"image_url": "https://example.com/b.jpg"}
+    _canonicalize_fields(single)
+    assert single == {"Images": ["https://example.com/b.jpg"]}
+
+
+def test_image_urls_selector_wins_over_images() -> None:
+    async def scrape(executor, sku: str) -> dict:
+        _ = executor, sku
+        return {
+            "success": True,
+            "results": {"Name": "Chew Toy", "Images": ["https://example.com/thumb.jpg"], "Image URLs": ["https://example.com/full.jpg"]},
+        }
+
+    job_config = _make_job(["SKU1"], max_workers=1)
+
+    with patch("runner.WorkflowExecutor", _executor_class(scrape)):
+        results = run_job(job_config, runner_name="test-runner")
+
+    assert results["data"]["SKU1"]["lane-scraper"]["images"] == ["https://example.com/full.jpg"]
+
+
+def test_progress_is_reported_as_each_sku_finishes() -> None:
+    timeline: list[str] = []
+
+    async def scrape(executor, sku: str) -> dict:
+        timeline.append(f"scrape {sku}")
+        return await _found(executor, sku)
+
+    def progress_callback(sku: str, scraper_name: str, data: dict) -> bool:
+        _ = scraper_name, data
+        timeline.append(f"progress {sku}")
+        return True
+
+    job_config = _make_job(["SKU1", "SKU2"], max_workers=1)
+
+    with patch("runner.WorkflowExecutor", _executor_class(scrape)):
+        run_job(job_config, runner_name="test-runner", progress_callback=progress_callback)
+
+    assert timeline == ["scrape SKU1", "progress SKU1", "scrape SKU2", "progress SKU2"]
+
+
+def test_blocking_progress_callback_does_not_stall_other_lanes() -> None:
+    other_lane_scraped = threading.Event()
+    seen_while_blocked: list[bool] = []
+
+    async def scrape(executor, sku: str) -> dict:
+        if sku == "SKU2":
+            await asyncio.sleep(0.05)
+            other_lane_scraped.set()
+        return await _found(executor, sku)
+
+    def progress_callback(sku: str, scraper_name: str, data: dict) -> bool:
+        _ = scraper_name, data
+        if sku == "SKU1":
+            # Blocks like a slow progress POST until the other lane gets a turn
+            seen_while_blocked.append(other_lane_scraped.wait(timeout=2))
+        return True
+
+    job_config = _make_job(["SKU1", "SKU2"], max_workers=2)
+
+    with patch("runner.WorkflowExecutor", _executor_class(scrape)):
+        results = run_job(job_config, runner_name="test-runner", progress_callback=progress_callback)
+
+    assert seen_while_blocked == [True]
+    assert results["skus_processed"] == 2
+
+
+def test_job_telemetry_is_folded_from_events_emitted_during_the_job() -> None:
+    from core.events import event_bus
+
+    async def scrape(executor, sku: str) -> dict:
+        executor.event_emitter.selector_resolved(scraper="lane-scraper", selector_name="Name", selector_value="h1", found=True, sku=sku)
+        return await _found(executor, sku)
+
+    job_config = _make_job(["SKU1", "SKU2"], max_workers=1)
+    subscribers_before = len(event_bus._subscribers)
+
+    with patch("runner.WorkflowExecutor", _executor_class(scrape)):
+        results = run_job(job_config, runner_name="test-runner")
+
+    assert [(entry["sku"], entry["status"]) for entry in results["telemetry"]["selectors"]] == [("SKU1", "FOUND"), ("SKU2", "FOUND")]
+    assert len(event_bus._subscribers) == subscribers_before
+
+
+def test_step_selector_and_extraction_events_fold_into_telemetry() -> None:
+    from core.events import EventType, ScraperEvent, event_bus
+
+    def emit(event_type: str, data: dict) -> None:
+        event_bus.emit(ScraperEvent(event_type=EventType(event_type), job_id="test-job-lanes", data=data, timestamp="2026-01-01T00:00:00Z"))
+
+    async def scrape(executor, sku: str) -> dict:
+        emit("step.started", {"step": {"index": 1, "action": "navigate"}})
+        emit("step.completed", {"step": {"index": 0, "action": "search"}, "timing": {"duration_ms": 5}, "extraction": {"Name": "x"}, "sku": sku})
+        emit("step.failed", {"step": {"index": 1, "action": "click"}, "error": {"message": "boom"}, "sku": sku})
+        emit("step.skipped", {"step": {"index": "not-an-int"}})
+        emit("step.skipped", {"step": {"index": 5000}, "reason": "late"})
+        emit("step.skipped", {"step": {"index": -1}, "reason": "early"})
+        emit("selector.resolved", {"selector": {"name": "title", "value": "h1", "found": False, "error": "bad"}, "sku": sku})
+        emit("extraction.completed", {"extraction": {"field_name": "Name", "value": 3}, "sku": sku})
+        return await _found(executor, sku)
+
+    with patch("runner.WorkflowExecutor", _executor_class(scrape)):
+        telemetry = run_job(_make_job(["SKU1"], max_workers=1), runner_name="test-runner")["telemetry"]
+
+    assert [(step["step_index"], step["action_type"], step["status"]) for step in telemetry["steps"]] == [
+        (-1, "unknown", "skipped"),
+        (0, "search", "completed"),
+        (1, "click", "failed"),
+        (5000, "unknown", "skipped"),
+    ]
+    assert telemetry["steps"][1]["duration_ms"] == 5
+    assert telemetry["steps"][1]["extracted_data"] == {"Name": "x"}
+    assert telemetry["steps"][2]["started_at"] == "2026-01-01T00:00:00Z"
+    assert telemetry["steps"][2]["error_message"] == "boom"
+    assert telemetry["selectors"][0]["status"] == "ERROR"
+    assert telemetry["selectors"][0]["error_message"] == "bad"
+    assert telemetry["extractions"][0]["field_value"] == "3"
+    assert telemetry["extractions"][0]["status"] == "SUCCESS"
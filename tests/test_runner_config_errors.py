@@ -264,3 +264,108 @@ def test_empty_object_selectors_payload_does_not_fail_parsing() -> None:
 
     assert results is not None
     assert "bradley" in results["scrapers_run"]
+
+
+def test_identical_scraper_configs_are_parsed_once() -> None:
+    import runner
+    from scrapers.parser import ScraperConfigParser
+
+    runner._parsed_config_cache.clear()
+
+    def make_job(job_id: str) -> JobConfig:
+        return JobConfig(
+            job_id=job_id,
+            skus=["SKU001"],
+            scrapers=[
+                ScraperConfig(
+                    name="cached-scraper",
+                    base_url="https://example.com",
+                    search_url_template="https://example.com/search?q={sku}",
+                    selectors=[{"name": "Name", "selector": "h1"}],
+                    options={},
+                    test_skus=[],
+                )
+            ],
+            test_mode=False,
+            max_workers=1,
+        )
+
+    class StubWorkflowExecutor:
+        def __init__(self, *args, **kwargs):
+            _ = args, kwargs
+            self.browser = None
+
+        async def initialize(self):
+            return None
+
+        async def execute_workflow(self, context=None, quit_browser=False):
+            _ = context, quit_browser
+            return {"success": False, "results": {}}
+
+    original_load = ScraperConfigParser.load_from_dict
+    with (
+        patch("runner.WorkflowExecutor", StubWorkflowExecutor),
+        patch.object(ScraperConfigParser, "load_from_dict", autospec=True, side_effect=original_load) as load_mock,
+    ):
+        run_job(make_job("test-job-cache-1"), runner_name="test-runner")
+        run_job(make_job("test-job-cache-2"), runner_name="test-runner")
+
+    assert load_mock.call_count == 1
+
+
+def test_cached_scraper_configs_are_not_shared_between_callers() -> None:
+    import runner
+    from scrapers.parser import ScraperConfigParser
+
+    runner._parsed_config_cache.clear()
+    scraper_cfg = ScraperConfig(
+        name="cached-scraper",
+        base_url="https://example.com",
+        search_url_template="https://example.com/search?q={sku}",
+        selectors=[{"name": "Name", "selector": "h1"}],
+        options={},
+        test_skus=[],
+    )
+    parser = ScraperConfigParser()
+
+    first = runner._load_scraper_config(parser, scraper_cfg)
+    first.selectors[0].selector = "h2"
+    first.base_url = "https://mutated.example.com"
+    second = runner._load_scraper_config(parser, scraper_cfg)
+
+    assert second is not first
+    assert second.selectors[0].selector == "h1"
+    assert second.base_url == "https://example.com"
+
+
+def test_invalid_config_fails_before_any_browser_launch() -> None:
+    job_config = JobConfig(
+        job_id="test-job-fail-fast",
+        skus=["SKU001"],
+        scrapers=[
+            ScraperConfig(
+                name="valid-scraper",
+                base_url="https://example.com",
+                search_url_template="https://example.com/search?q={sku}",
+                selectors=[],
+                options={},
+                test_skus=[],
+            ),
+            ScraperConfig(
+                name="invalid-scraper",
+                base_url="https://example.com",
+                search_url_template="https://example.com/search?q={sku}",
+                selectors=[{"name": "bad_selector"}],
+                options={},
+                test_skus=[],
+            ),
+        ],
+        test_mode=False,
+        max_workers=1,
+    )
+
+    executor_class = MagicMock()
+    with patch("runner.WorkflowExecutor", executor_class), pytest.raises(ConfigurationError):
+        run_job(job_config, runner_name="test-runner")
+
+    executor_class.assert_not_called()
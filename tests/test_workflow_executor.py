@@ -240,3 +240,60 @@ async def test_agentic_initialize_creates_browser_use_browser_and_ai_context() -
     assert executor.ai_browser is not None
     assert executor.ai_context["scraper_type"] == "agentic"
     assert executor.ai_context["browser_initialized"] is True
+
+
+@pytest.mark.anyio
+async def test_pooled_browsers_share_one_chromium_launch() -> None:
+    from unittest.mock import MagicMock
+
+    from utils.scraping.playwright_browser import PlaywrightBrowserPool, create_playwright_browser
+
+    chromium_browser = MagicMock()
+    chromium_browser.is_connected.return_value = True
+    chromium_browser.new_context = AsyncMock(side_effect=lambda **_: MagicMock(new_page=AsyncMock(return_value=MagicMock()), close=AsyncMock()))
+    chromium_browser.close = AsyncMock()
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(return_value=chromium_browser)
+    playwright.stop = AsyncMock()
+    starter = MagicMock()
+    starter.return_value.start = AsyncMock(return_value=playwright)
+
+    pool = PlaywrightBrowserPool()
+    with patch("utils.scraping.playwright_browser.async_playwright", starter):
+        first = await create_playwright_browser("first", browser_pool=pool)
+        second = await create_playwright_browser("second", browser_pool=pool)
+        await first.quit()
+
+        assert playwright.chromium.launch.await_count == 1
+        assert first.playwright is None and second.browser is chromium_browser
+        chromium_browser.close.assert_not_awaited()
+
+        await second.quit()
+        await pool.close()
+
+    chromium_browser.close.assert_awaited_once()
+    playwright.stop.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_browser_pool_relaunches_a_disconnected_chromium() -> None:
+    from unittest.mock import MagicMock
+
+    from utils.scraping.playwright_browser import PlaywrightBrowserPool
+
+    crashed, relaunched = MagicMock(), MagicMock()
+    crashed.is_connected.return_value = False
+    relaunched.is_connected.return_value = True
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(side_effect=[crashed, relaunched])
+    starter = MagicMock()
+    starter.return_value.start = AsyncMock(return_value=playwright)
+
+    pool = PlaywrightBrowserPool()
+    with patch("utils.scraping.playwright_browser.async_playwright", starter):
+        assert await pool.get() is crashed
+        assert await pool.get() is relaunched
+        assert await pool.get() is relaunched
+
+    assert playwright.chromium.launch.await_count == 2
+    starter.return_value.start.assert_awaited_once()
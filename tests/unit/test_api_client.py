@@ -47,7 +47,7 @@ class TestScraperAPIClient:
         mock_response.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = mock_response
 
             result = self.client._make_request("GET", "/api/test")
@@ -57,12 +57,34 @@ class TestScraperAPIClient:
             call_args = mock_instance.get.call_args
             assert call_args[1]["headers"]["X-API-Key"] == "test-api-key"
 
+    def test_make_request_reuses_one_http_client(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"success": True}
+
+        with patch("httpx.Client") as mock_client:
+            mock_client.return_value.get.return_value = mock_response
+
+            self.client._make_request("GET", "/api/one")
+            self.client._make_request("GET", "/api/two")
+
+            assert mock_client.call_count == 1
+            assert mock_client.return_value.get.call_count == 2
+
+    def test_close_releases_http_client(self):
+        with patch("httpx.Client") as mock_client:
+            with self.client as client:
+                client._get_http_client()
+
+            mock_client.return_value.close.assert_called_once()
+            assert self.client._http_client is None
+
     def test_make_request_401_raises_auth_error(self):
         mock_response = MagicMock()
         mock_response.status_code = 401
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = mock_response
 
             with pytest.raises(AuthenticationError):
@@ -80,7 +102,7 @@ class TestScraperAPIClient:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = mock_response
 
             job_config = self.client.get_job_config("job-123")
@@ -103,7 +125,7 @@ class TestScraperAPIClient:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = mock_response
 
             job_config = self.client.get_job_config("job-124")
@@ -131,7 +153,7 @@ class TestScraperAPIClient:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.post.return_value = mock_response
 
             job = self.client.poll_for_work()
@@ -146,7 +168,7 @@ class TestScraperAPIClient:
         mock_response.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value.post
+            mock_instance = mock_client.return_value.post
             mock_instance.return_value = mock_response
 
             success = self.client.submit_results(
@@ -182,7 +204,7 @@ class TestScraperAPIClient:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.post.return_value = mock_response
 
             claimed = self.client.claim_chunk("runner-1")
@@ -199,7 +221,7 @@ class TestScraperAPIClient:
         mock_response.json.return_value = {"chunk": None}
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.post.return_value = mock_response
 
             claimed = self.client.claim_chunk("runner-1")
@@ -224,7 +246,7 @@ class TestRetryLogic:
         mock_response.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = mock_response
 
             result = self.client._make_request("GET", "/api/test")
@@ -243,7 +265,7 @@ class TestRetryLogic:
         success_response.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.side_effect = [
                 httpx.HTTPStatusError("500", request=MagicMock(), response=error_response),
                 success_response,
@@ -265,7 +287,7 @@ class TestRetryLogic:
         success_response.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.side_effect = [
                 httpx.HTTPStatusError("503", request=MagicMock(), response=error_response),
                 httpx.HTTPStatusError("503", request=MagicMock(), response=error_response),
@@ -284,7 +306,7 @@ class TestRetryLogic:
         error_response.text = "Bad Request"
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = error_response
             # Patch raise_for_status to raise HTTPStatusError
             mock_instance.get.return_value.raise_for_status.side_effect = httpx.HTTPStatusError("400", request=MagicMock(), response=error_response)
@@ -301,7 +323,7 @@ class TestRetryLogic:
         error_response.text = "Not Found"
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = error_response
             mock_instance.get.return_value.raise_for_status.side_effect = httpx.HTTPStatusError("404", request=MagicMock(), response=error_response)
 
@@ -317,7 +339,7 @@ class TestRetryLogic:
         error_response.text = "Unauthorized"
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = error_response
 
             with pytest.raises(AuthenticationError):
@@ -332,7 +354,7 @@ class TestRetryLogic:
         success_response.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.side_effect = [
                 httpx.NetworkError("Connection refused"),
                 success_response,
@@ -350,7 +372,7 @@ class TestRetryLogic:
         success_response.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.side_effect = [
                 httpx.TimeoutException("Request timed out"),
                 success_response,
@@ -368,7 +390,7 @@ class TestRetryLogic:
         error_response.text = "Internal Server Error"
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.side_effect = httpx.HTTPStatusError("500", request=MagicMock(), response=error_response)
 
             with pytest.raises(httpx.HTTPStatusError):
@@ -385,7 +407,7 @@ class TestRetryLogic:
 
         with patch("httpx.Client") as mock_client:
             with patch("time.sleep") as mock_sleep:
-                mock_instance = mock_client.return_value.__enter__.return_value
+                mock_instance = mock_client.return_value
                 mock_instance.get.side_effect = [
                     httpx.NetworkError("Connection refused"),
                     httpx.NetworkError("Connection refused"),
@@ -412,7 +434,7 @@ class TestRetryLogic:
         success_response.json.return_value = {"success": True}
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.side_effect = [
                 httpx.HTTPStatusError("429", request=MagicMock(), response=error_response),
                 success_response,
@@ -440,7 +462,7 @@ class TestHealthCheck:
         mock_response.status_code = 200
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = mock_response
 
             result = self.client.health_check()
@@ -470,7 +492,7 @@ class TestHealthCheck:
         mock_response.text = "Internal Server Error"
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = mock_response
 
             with pytest.raises(ConnectionError) as exc_info:
@@ -481,7 +503,7 @@ class TestHealthCheck:
     def test_health_check_raises_connection_error_on_network_error(self):
         """Health check raises ConnectionError on network failure."""
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.side_effect = httpx.NetworkError("Connection refused")
 
             with pytest.raises(ConnectionError) as exc_info:
@@ -492,7 +514,7 @@ class TestHealthCheck:
     def test_health_check_raises_connection_error_on_timeout(self):
         """Health check raises ConnectionError when request times out."""
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.side_effect = httpx.TimeoutException("Request timed out")
 
             with pytest.raises(ConnectionError) as exc_info:
@@ -506,7 +528,7 @@ class TestHealthCheck:
         mock_response.status_code = 200
 
         with patch("httpx.Client") as mock_client:
-            mock_instance = mock_client.return_value.__enter__.return_value
+            mock_instance = mock_client.return_value
             mock_instance.get.return_value = mock_response
 
             self.client.health_check()
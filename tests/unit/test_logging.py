@@ -11,7 +11,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 
 import pytest
 from core.api_client import ScraperAPIClient
-from utils.api_handler import ScraperAPIHandler
+from utils.api_handler import LogBatcher, ScraperAPIHandler
 from utils.logger import JSONFormatter, setup_logging, reset_logging
 
 
@@ -195,6 +195,33 @@ class TestScraperAPIHandler:
         assert len(args[1]) == 1
         assert args[1][0]["message"] == "Message before close"
 
+    def test_full_buffer_ships_before_flush_interval(self):
+        """Reaching buffer_size ships a batch without waiting for the interval."""
+        mock_client = MagicMock()
+
+        handler = ScraperAPIHandler(
+            mock_client,
+            job_id="test-job",
+            buffer_size=2,
+            flush_interval=60.0,
+            max_retries=1,
+        )
+
+        logger = logging.getLogger("test_full_buffer")
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+
+        logger.info("Message 1")
+        logger.info("Message 2")
+
+        time.sleep(0.3)
+
+        mock_client.post_logs.assert_called_once()
+        assert [entry["message"] for entry in mock_client.post_logs.call_args[0][1]] == ["Message 1", "Message 2"]
+
+        logger.removeHandler(handler)
+        handler.close()
+
     def test_no_infinite_recursion(self):
         """Test that API logging doesn't cause infinite recursion."""
         mock_client = MagicMock()
@@ -220,6 +247,50 @@ class TestScraperAPIHandler:
         handler.close()
 
 
+class TestLogBatcher:
+    """Tests for the LogBatcher log buffer."""
+
+    def test_ships_full_batches_and_residual_on_close(self):
+        """Entries are posted in batch_size groups, with the remainder on close."""
+        mock_client = MagicMock()
+        batcher = LogBatcher(mock_client, job_id="test-job", batch_size=2, flush_interval=60.0)
+
+        for i in range(5):
+            batcher.append({"message": f"entry {i}"})
+        batcher.close()
+
+        shipped = [call.args[1] for call in mock_client.post_logs.call_args_list]
+        assert [len(batch) for batch in shipped] == [2, 2, 1]
+        assert all(call.args[0] == "test-job" for call in mock_client.post_logs.call_args_list)
+        # Entries remain available for attaching to results
+        assert len(batcher) == 5
+
+    def test_quiet_job_ships_pending_entries_after_flush_interval(self):
+        """Pending entries are shipped once flush_interval passes, without another append."""
+        mock_client = MagicMock()
+        batcher = LogBatcher(mock_client, job_id="test-job", batch_size=100, flush_interval=0.05)
+
+        batcher.append({"message": "last entry"})
+        deadline = time.monotonic() + 2
+        while not mock_client.post_logs.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert mock_client.post_logs.call_args.args[1] == [{"message": "last entry"}]
+        batcher.close()
+        assert mock_client.post_logs.call_count == 1
+
+    def test_post_failure_does_not_raise(self):
+        """A failed post is reported to stderr, not raised into the caller."""
+        mock_client = MagicMock()
+        mock_client.post_logs.side_effect = RuntimeError("boom")
+        batcher = LogBatcher(mock_client, job_id="test-job", batch_size=1, flush_interval=60.0)
+
+        batcher.append({"message": "entry"})
+        batcher.close()
+
+        assert mock_client.post_logs.call_count == 1
+
+
 class TestSetupLogging:
     """Tests for the setup_logging function."""
 
@@ -0,0 +1,23 @@
+"""Tests for ResultCollector's local session file."""
+
+import json
+from unittest.mock import patch
+
+from scrapers.result_collector import ResultCollector
+
+
+def test_add_results_writes_session_file_once(tmp_path) -> None:
+    collector = ResultCollector(output_dir=str(tmp_path), retain_results=False)
+    batch = [
+        ("SKU1", "site-a", {"Name": "Chew Toy", "Images": ["https://example.com/1.jpg"]}),
+        ("SKU2", "site-a", {"Brand": "Acme"}),
+        ("SKU3", "site-a", {"Description": "no identifying fields"}),
+    ]
+
+    with patch("scrapers.result_collector.json.dump", wraps=json.dump) as dump_mock:
+        collector.add_results(batch)
+
+    assert dump_mock.call_count == 1
+    session = json.loads(next(tmp_path.glob("session_*.json")).read_text())
+    assert set(session["results"]["site-a"]) == {"SKU1", "SKU2"}
+    assert session["results"]["site-a"]["SKU1"]["data"]["Name"] == "Chew Toy"
@@ -1,5 +1,6 @@
 import atexit
 import logging
+import queue
 import sys
 import threading
 import time
@@ -82,35 +83,43 @@ class ScraperAPIHandler(logging.Handler):
         """Background loop that ships logs periodically."""
         while not self._stop_event.is_set():
             # Wait for flush event or timeout
-            flush_waited = self._flush_event.wait(timeout=self.flush_interval)
+            self._flush_event.wait(timeout=self.flush_interval)
 
             if self._stop_event.is_set():
                 break
 
+            # Clear before shipping so a batch that fills up meanwhile re-triggers
+            self._flush_event.clear()
+
             # Flush if needed
             if self._buffer:
                 self._ship_buffer()
 
-            # Clear flush event
-            if flush_waited:
-                self._flush_event.clear()
-
     def _ship_buffer(self) -> None:
         """Ship the current buffer to the API with retry logic."""
         if not self._buffer:
             return
 
-        # Copy buffer under lock
-        with threading.Lock():
-            if not self._buffer:
-                return
-            logs_to_send = list(self._buffer)
-            self._buffer.clear()
+        # Drain with popleft: deque pops are atomic, so records emitted while
+        # draining stay in the buffer for the next batch instead of being lost
+        logs_to_send = self._drain_buffer()
+        if not logs_to_send:
+            return
 
         # Ship with retry
         self._send_with_retry(logs_to_send)
         self._last_flush_time = time.time()
 
+    def _drain_buffer(self) -> list:
+        """Remove and return the entries currently in the buffer."""
+        drained = []
+        for _ in range(len(self._buffer)):
+            try:
+                drained.append(self._buffer.popleft())
+            except IndexError:
+                break
+        return drained
+
     def _send_with_retry(self, logs: list) -> None:
         """Send logs with exponential backoff retry."""
         if not logs:
@@ -161,16 +170,12 @@ class ScraperAPIHandler(logging.Handler):
                 log_entry["error_type"] = record.exc_info[0].__name__ if record.exc_info[0] else None
                 log_entry["error_message"] = str(record.exc_info[1]) if record.exc_info[1] else None
 
-            # Add to buffer (non-blocking, uses deque with maxlen)
-            try:
-                self._buffer.append(log_entry)
-            except IndexError:
-                # Buffer full - drop oldest to make room
-                try:
-                    self._buffer.popleft()
-                    self._buffer.append(log_entry)
-                except IndexError:
-                    pass  # Still full, drop this log
+            # Add to buffer (non-blocking; a full deque drops its oldest entry)
+            self._buffer.append(log_entry)
+
+            # Ship a full batch now rather than waiting out the flush interval
+            if len(self._buffer) >= self.buffer_size:
+                self._flush_event.set()
 
         except Exception:
             # Best effort - don't let logging failures affect scraper
@@ -209,9 +214,7 @@ class ScraperAPIHandler(logging.Handler):
             # Final flush attempt
             if self._buffer:
                 try:
-                    logs_to_send = list(self._buffer)
-                    self._buffer.clear()
-                    self._send_with_retry(logs_to_send)
+                    self._send_with_retry(self._drain_buffer())
                 except Exception:
                     pass
 
@@ -224,3 +227,96 @@ class ScraperAPIHandler(logging.Handler):
             self.close()
         except Exception:
             pass
+
+
+class LogBatcher(list):
+    """
+    Log buffer that streams its entries to the API in batches.
+
+    Drop-in replacement for the plain ``list`` log buffers passed to
+    ``run_job``: entries are still collected (so they can be attached to
+    results), but every ``batch_size`` entries or ``flush_interval`` seconds
+    the pending ones are handed to a background thread that calls
+    ``post_logs``. ``close()`` ships only the residual entries and stops the
+    thread, so a long job never ends with one oversized log POST.
+    """
+
+    def __init__(
+        self,
+        api_client: Any,
+        job_id: str,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+    ):
+        super().__init__()
+        self.api_client = api_client
+        self.job_id = job_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._pending: list = []
+        self._lock = threading.Lock()
+        self._last_flush_time = time.monotonic()
+        self._batches: queue.Queue = queue.Queue()
+        self._closed = False
+
+        self._shipping_thread = threading.Thread(
+            target=self._shipping_loop,
+            daemon=True,
+            name="log-batcher",
+        )
+        self._shipping_thread.start()
+
+    def append(self, entry: Any) -> None:
+        super().append(entry)
+        with self._lock:
+            if self._closed:
+                return
+            self._pending.append(entry)
+            if len(self._pending) >= self.batch_size or time.monotonic() - self._last_flush_time >= self.flush_interval:
+                self._queue_pending()
+
+    def extend(self, entries: Any) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def _queue_pending(self) -> None:
+        """Hand pending entries to the shipping thread. Caller holds the lock."""
+        if self._pending:
+            self._batches.put(self._pending)
+            self._pending = []
+        self._last_flush_time = time.monotonic()
+
+    def _shipping_loop(self) -> None:
+        """Background loop that posts queued batches in order.
+
+        It also wakes every ``flush_interval`` to queue entries that have
+        waited that long, so a quiet job's last entries don't sit until close().
+        """
+        while True:
+            try:
+                batch = self._batches.get(timeout=self.flush_interval)
+            except queue.Empty:
+                with self._lock:
+                    if time.monotonic() - self._last_flush_time >= self.flush_interval:
+                        self._queue_pending()
+                continue
+            if batch is None:
+                return
+            try:
+                self.api_client.post_logs(self.job_id, batch)
+            except Exception as e:
+                try:
+                    sys.stderr.write(f"[{_module_name}] Failed to ship {len(batch)} logs for job {self.job_id}: {e}\n")
+                except Exception:
+                    pass  # Best effort
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Ship any residual entries and stop the shipping thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue_pending()
+            self._batches.put(None)
+        self._shipping_thread.join(timeout=timeout)
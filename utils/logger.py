@@ -72,8 +72,10 @@ def _get_log_format() -> str:
 class NoHttpFilter(logging.Filter):
     """Filter to suppress httpx/httpcore noise from API client logging."""
 
+    _HTTP_LOGGER_PREFIXES = ("httpx", "httpcore", "urllib3")
+
     def filter(self, record: logging.LogRecord) -> bool:
-        return not (record.name.startswith("httpx") or record.name.startswith("httpcore") or record.name.startswith("urllib3"))
+        return not record.name.startswith(self._HTTP_LOGGER_PREFIXES)
 
 
 def setup_logging(
@@ -41,6 +41,59 @@ from playwright.sync_api import (
 )
 from playwright_stealth import Stealth
 
+# Chromium flags shared by every launch (pooled or per-scraper)
+_LAUNCH_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-extensions",
+    "--disable-infobars",
+    "--no-first-run",
+)
+
+
+class PlaywrightBrowserPool:
+    """
+    Shares one Chromium process between async scraper browsers.
+
+    Each PlaywrightScraperBrowser created with a pool opens its own context
+    (cookies, storage and pages stay isolated) on the pooled browser instead
+    of starting Playwright and launching Chromium itself. The pool is owned
+    by the caller, which must close() it once every scraper browser has quit.
+    """
+
+    def __init__(self, headless: bool = True) -> None:
+        self.headless = headless
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Browser:
+        """Return the shared browser, launching it on first use or after a crash."""
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless,
+                    args=list(_LAUNCH_ARGS),
+                )
+            return self._browser
+
+    async def close(self) -> None:
+        """Close the shared browser and stop Playwright."""
+        try:
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        except Exception as e:
+            print(f"[WARN] [BrowserPool] Error closing shared browser: {e}")
+        finally:
+            self._browser = None
+            self._playwright = None
+
 
 class PlaywrightScraperBrowser:
     """
@@ -54,6 +107,7 @@ class PlaywrightScraperBrowser:
         profile_suffix: str | None = None,
         custom_options: list[str] | None = None,
         timeout: int = 30,
+        browser_pool: PlaywrightBrowserPool | None = None,
     ) -> None:
         """
         Initialize browser for scraping.
@@ -64,12 +118,15 @@ class PlaywrightScraperBrowser:
             profile_suffix: Optional suffix for profile directory (unused in ephemeral context)
             custom_options: Additional Chrome args to add
             timeout: Default timeout in seconds
+            browser_pool: Optional pool whose shared Chromium is used instead of a
+                dedicated launch (custom_options and headless are then ignored)
         """
         self.site_name = site_name
         self.headless = headless
         self.profile_suffix = profile_suffix
         self.timeout = timeout * 1000  # Convert to ms
         self.custom_options = custom_options or []
+        self.browser_pool = browser_pool
 
         self.playwright: Playwright | None = None
         self.browser: Browser | None = None
@@ -84,27 +141,23 @@ class PlaywrightScraperBrowser:
         print(f"[WEB] [{self.site_name}] Initializing Playwright (Async)...")
 
         try:
-            self.playwright = await async_playwright().start()
-
-            # Construct launch arguments
-            args = [
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-gpu",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-extensions",
-                "--disable-infobars",
-                "--no-first-run",
-            ]
-
-            # Add custom options
-            if self.custom_options:
-                args.extend(self.custom_options)
-
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=args,
-            )
+            if self.browser_pool is not None:
+                # Pooled: only this scraper's context is ours to close
+                self.browser = await self.browser_pool.get()
+            else:
+                self.playwright = await async_playwright().start()
+
+                # Construct launch arguments
+                args = list(_LAUNCH_ARGS)
+
+                # Add custom options
+                if self.custom_options:
+                    args.extend(self.custom_options)
+
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    args=args,
+                )
 
             # Create context with standard viewport and user agent
             self.context = await self.browser.new_context(
@@ -158,7 +211,7 @@ class PlaywrightScraperBrowser:
         try:
             if self.context:
                 await self.context.close()
-            if self.browser:
+            if self.browser and self.browser_pool is None:
                 await self.browser.close()
             if self.playwright:
                 await self.playwright.stop()
@@ -199,6 +252,7 @@ async def create_playwright_browser(
     profile_suffix: str | None = None,
     custom_options: list[str] | None = None,
     timeout: int = 30,
+    browser_pool: PlaywrightBrowserPool | None = None,
 ) -> PlaywrightScraperBrowser:
     """Factory for Async Browser."""
     browser = PlaywrightScraperBrowser(
@@ -207,6 +261,7 @@ async def create_playwright_browser(
         profile_suffix,
         custom_options,
         timeout,
+        browser_pool,
     )
     await browser.initialize()
     return browser
@@ -40,6 +40,9 @@ class SensitiveDataFilter(logging.Filter):
         (r'Authorization["\']?\s*[:=]\s*["\']?[^\s"\']+', "[AUTH_REDACTED]"),
     ]
 
+    # Compiled once; filter() runs on every log record
+    _COMPILED_PATTERNS = [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in SENSITIVE_PATTERNS]
+
     def filter(self, record: LogRecord) -> bool:
         """Redact sensitive data from log message and extra fields."""
         # Redact from message
@@ -62,8 +65,8 @@ class SensitiveDataFilter(logging.Filter):
     def _redact(self, text: str) -> str:
         """Apply all redaction patterns to text."""
         result = text
-        for pattern, replacement in self.SENSITIVE_PATTERNS:
-            result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+        for pattern, replacement in self._COMPILED_PATTERNS:
+            result = pattern.sub(replacement, result)
         return result
 
 